@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
+# of Oxford, and the 'Galv' Developers. All rights reserved.
+
+"""
+URL routing helpers used by the project URLconf (config/urls.py).
+"""
+
+from django.urls import include, path, re_path, URLPattern, URLResolver
+from django.urls.resolvers import RoutePattern
+from rest_framework import routers
+
+
+class PrefixTreeRouter(routers.DefaultRouter):
+    """
+    DefaultRouter that mounts each viewset's routes under an include() keyed on
+    its static prefix, rather than emitting one flat regex per route.
+
+    The resolver only descends into the include whose prefix matches the request
+    path, so dispatch costs one cheap prefix test per viewset plus the handful
+    of route regexes belonging to the viewset that owns the URL.
+    Public paths, format suffixes and URL names are identical to DefaultRouter's.
+    """
+
+    def get_urls(self):
+        grouped = {prefix: [] for prefix, _, _ in self.registry}
+        ungrouped = []
+        for url in super().get_urls():
+            regex = url.pattern.regex.pattern
+            prefix = regex[1:].split("/", 1)[0]
+            if prefix in grouped and regex.startswith(f"^{prefix}/"):
+                grouped[prefix].append(
+                    re_path(
+                        f"^{regex[len(prefix) + 2:]}",
+                        url.callback,
+                        url.default_args,
+                        url.name,
+                    )
+                )
+            else:
+                # API root and list-route format suffixes (e.g. labs.json)
+                ungrouped.append(url)
+        return [
+            path(f"{prefix}/", include(urls))
+            for prefix, urls in grouped.items()
+            if urls
+        ] + ungrouped
+
+
+class LiteralRoutePattern(RoutePattern):
+    """
+    RoutePattern that matches converter-free endpoint routes (e.g. 'login/')
+    by plain string comparison instead of running the compiled regex.
+    Reversal and schema generation still use the regular RoutePattern machinery.
+    """
+
+    def match(self, path):
+        if self._is_endpoint and not self.converters:
+            return ("", (), {}) if path == self._route else None
+        return super().match(path)
+
+
+def literal_path(route, view, name):
+    return URLPattern(
+        LiteralRoutePattern(route, name=name, is_endpoint=True), view, name=name
+    )
+
+
+def compile_patterns(patterns):
+    """
+    Compile every route regex at URLconf import rather than on the first
+    request that happens to reach each pattern.
+    """
+    for url in patterns:
+        url.pattern.regex  # compiled and cached by the pattern descriptor
+        if isinstance(url, URLResolver):
+            compile_patterns(url.url_patterns)
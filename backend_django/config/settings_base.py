@@ -84,6 +84,7 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "galv.middleware.AppendSlashMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
@@ -93,6 +94,15 @@ MIDDLEWARE = [
 ]
 SNAKEVIZ_PROFILING = "PLEASE_PROFILE_REQUESTS"
 
+
+def show_debug_toolbar(request):
+    # Read DEBUG at request time rather than settings-load time:
+    # the test runner switches it off, and the toolbar's URLs are only mounted when it is on.
+    from django.conf import settings
+
+    return settings.DEBUG
+
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
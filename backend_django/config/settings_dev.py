@@ -30,7 +30,7 @@ CSRF_TRUSTED_ORIGINS = CORS_ALLOWED_ORIGINS  # noqa: F405
 
 # for django-debug-toolbar
 DEBUG_TOOLBAR_CONFIG = {
-    "SHOW_TOOLBAR_CALLBACK": lambda request: DEBUG,
+    "SHOW_TOOLBAR_CALLBACK": show_debug_toolbar,  # noqa: F405
     "DEBUG_TOOLBAR_PANELS": [
         "cachalot.panels.CachalotPanel",
     ],
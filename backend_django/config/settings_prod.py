@@ -29,7 +29,7 @@ DEBUG = os.environ.get("DJANGO_DEBUG", "False") == "True"
 
 # for django-debug-toolbar
 DEBUG_TOOLBAR_CONFIG = {
-    "SHOW_TOOLBAR_CALLBACK": lambda request: DEBUG,
+    "SHOW_TOOLBAR_CALLBACK": show_debug_toolbar,  # noqa: F405
 }
 
 CSRF_TRUSTED_ORIGINS = [
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
+# of Oxford, and the 'Galv' Developers. All rights reserved.
+
+"""
+Settings for running the test suite.
+
+Test runs build their database straight from the models rather than replaying
+every migration, and hash the test users' passwords with a cheap algorithm.
+"""
+
+from .settings_dev import *  # noqa: F401, F403
+
+
+class _DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = _DisableMigrations()
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
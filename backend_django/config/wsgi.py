@@ -14,7 +14,12 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Import the URLconf and build the resolver's reverse/namespace lookups while the
+# worker boots, rather than on whichever request first resolves or reverses a URL.
+get_resolver().reverse_dict
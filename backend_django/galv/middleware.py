@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
+# of Oxford, and the 'Galv' Developers. All rights reserved.
+
+from django.conf import settings
+from django.urls import get_urlconf, is_valid_path
+
+
+class AppendSlashMiddleware:
+    """
+    Serve slash-less URLs (e.g. /labs) from their canonical slashed route.
+
+    CommonMiddleware's APPEND_SLASH answers these with a 301, so the client pays
+    a second round trip and the server resolves the URL twice.
+    Rewriting the path in place serves the request straight away,
+    and also works for POST/PUT/PATCH, whose bodies a redirect would drop.
+
+    Must come before CommonMiddleware so that it no longer sees slash-less paths.
+    Like CommonMiddleware, it does nothing unless settings.APPEND_SLASH is set.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.append_slash = settings.APPEND_SLASH
+
+    def __call__(self, request):
+        path_info = request.path_info
+        if self.append_slash and not path_info.endswith("/"):
+            urlconf = getattr(request, "urlconf", None) or get_urlconf()
+            if not is_valid_path(path_info, urlconf) and is_valid_path(
+                f"{path_info}/", urlconf
+            ):
+                request.path_info = f"{path_info}/"
+                request.path = f"{request.path}/"
+        return self.get_response(request)
@@ -1,14 +1,20 @@
 # SPDX-License-Identifier: BSD-2-Clause
 # Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
 # of Oxford, and the 'Galv' Developers. All rights reserved.
+import collections
+import copy
+import functools
 import os
 import re
+import threading
 
 import jsonschema
 from django.conf import settings
 from django.core.files.storage import Storage
 from django.db import models
 from django.db.models import Sum
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.test import RequestFactory
 from django.utils import timezone
 from django.utils.crypto import get_random_string
@@ -111,10 +117,11 @@ class UserAuthDetails:
         self.is_approved = is_approved
         self.is_harvester = is_harvester
         self.is_lab_admin = is_lab_admin
-        self.lab_ids = lab_ids | writeable_lab_ids
-        self.writeable_lab_ids = writeable_lab_ids
-        self.team_ids = team_ids | writeable_team_ids
-        self.writeable_team_ids = writeable_team_ids
+        # Frozen so that the details cached on a request can't drift while it is served
+        self.lab_ids = frozenset(lab_ids | writeable_lab_ids)
+        self.writeable_lab_ids = frozenset(writeable_lab_ids)
+        self.team_ids = frozenset(team_ids | writeable_team_ids)
+        self.writeable_team_ids = frozenset(writeable_team_ids)
 
 
 def get_user_auth_details(request):
@@ -334,7 +341,7 @@ class UserProxy(User):
             t = g.owner
             if (
                 isinstance(t, Team)
-                and t.lab.pk in get_user_auth_details(request).lab_ids
+                and t.lab_id in get_user_auth_details(request).lab_ids
             ):
                 return True
         return False
@@ -748,7 +755,10 @@ class Lab(TimestampedModel):
         """
         storage_types = []
         for model in _StorageType.__subclasses__():
-            storage_types.extend(list(model.objects.filter(lab=self)))
+            # Use the reverse relation so that prefetch_related() results are reused
+            storage_types.extend(
+                getattr(self, f"storage_{model._meta.model_name}").all()
+            )
         return sorted(storage_types, key=lambda x: x.priority, reverse=True)
 
     def get_storage(self, instance, saving=False):
@@ -812,13 +822,13 @@ class Team(TimestampedModel):
 
     def has_object_read_permission(self, request):
         return (
-            self.lab.pk in get_user_auth_details(request).writeable_lab_ids
+            self.lab_id in get_user_auth_details(request).writeable_lab_ids
             or self.pk in get_user_auth_details(request).team_ids
         )
 
     def has_object_write_permission(self, request):
         return (
-            self.lab.pk in get_user_auth_details(request).writeable_lab_ids
+            self.lab_id in get_user_auth_details(request).writeable_lab_ids
             or self.pk in get_user_auth_details(request).writeable_team_ids
         )
 
@@ -881,12 +891,13 @@ class ResourceModelPermissionsMixin(TimestampedModel):
     }
 
     def get_user_level(self, request):
-        if self.team:
-            if self.team.pk in get_user_auth_details(request).writeable_team_ids:
+        # Check the team id first: the team itself is only loaded for the lab check
+        if self.team_id is not None:
+            if self.team_id in get_user_auth_details(request).writeable_team_ids:
                 return UserLevel.TEAM_ADMIN.value
-            if self.team.pk in get_user_auth_details(request).team_ids:
+            if self.team_id in get_user_auth_details(request).team_ids:
                 return UserLevel.TEAM_MEMBER.value
-            if self.team.lab.pk in get_user_auth_details(request).lab_ids:
+            if self.team.lab_id in get_user_auth_details(request).lab_ids:
                 return UserLevel.LAB_MEMBER.value
         if get_user_auth_details(request).is_authenticated:
             return UserLevel.REGISTERED_USER.value
@@ -1058,11 +1069,6 @@ class CellFamily(CustomPropertiesModel, ResourceModelPermissionsMixin):
     class Meta(CustomPropertiesModel.Meta):
         unique_together = [["model", "manufacturer"]]
 
-    def save(
-        self, force_insert=False, force_update=False, using=None, update_fields=None
-    ):
-        super(CellFamily, self).save(force_insert, force_update, using, update_fields)
-
 
 class Cell(JSONModel, ResourceModelPermissionsMixin, ValidatableBySchemaMixin):
     identifier = models.TextField(
@@ -1179,6 +1185,14 @@ class Equipment(JSONModel, ResourceModelPermissionsMixin, ValidatableBySchemaMix
         }
 
 
+@functools.lru_cache(maxsize=1024)
+def _pybamm_template_variable_names(template: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Parse a PyBaMM template's variable names, memoised on the template's lines.
+    """
+    return tuple(re.findall(r"\{([\w_]+)}", "\n".join(template)))
+
+
 class ScheduleFamily(CustomPropertiesModel, ResourceModelPermissionsMixin):
     identifier = models.OneToOneField(
         to=ScheduleIdentifiers,
@@ -1207,8 +1221,7 @@ class ScheduleFamily(CustomPropertiesModel, ResourceModelPermissionsMixin):
     }
 
     def pybamm_template_variable_names(self):
-        template = "\n".join(self.pybamm_template)
-        return re.findall(r"\{([\w_]+)}", template)
+        return list(_pybamm_template_variable_names(tuple(self.pybamm_template)))
 
     def in_use(self) -> bool:
         return self.schedules.count() > 0
@@ -1367,17 +1380,21 @@ class ColumnMapping(UUIDModel, ResourceModelPermissionsMixin):
     def in_use(self) -> bool:
         return self.observed_files.count() > 0
 
-    @property
+    def get_missing_required_columns(self, required_columns) -> list[str]:
+        """
+        Return the names of the (pk, name) required columns that this map does not use.
+        """
+        ids = [col["column_type"] for col in self.map.values()]
+        return [name for pk, name in required_columns if pk not in ids]
+
+    @functools.cached_property
     def missing_required_columns(self) -> list[str]:
         """
         Return a list of missing required columns.
         """
-        ids = [col["column_type"] for col in self.map.values()]
-        missing = []
-        for col in DataColumnType.objects.filter(is_required=True):
-            if col.pk not in ids:
-                missing.append(col.name)
-        return missing
+        return self.get_missing_required_columns(
+            DataColumnType.objects.filter(is_required=True).values_list("pk", "name")
+        )
 
     @property
     def is_valid(self) -> bool:
@@ -1386,6 +1403,33 @@ class ColumnMapping(UUIDModel, ResourceModelPermissionsMixin):
         """
         return len(self.missing_required_columns) == 0
 
+    @property
+    def rendered_map(self) -> dict:
+        """
+        Return the map with each column's new name and data type filled in
+        from its DataColumnType, in the form used to process file data.
+        """
+        out = {}
+        # Fetch all the mapped column types in one query
+        column_types = {
+            str(t.pk): t
+            for t in DataColumnType.objects.filter(
+                pk__in=[v["column_type"] for v in self.map.values()]
+            ).only("pk", "name", "data_type")
+        }
+        for key, value in self.map.items():
+            data_column_type = column_types.get(str(value["column_type"]))
+            if data_column_type is None:
+                data_column_type = DataColumnType.objects.get(pk=value["column_type"])
+            out[key] = {
+                "new_name": value.get("new_name", data_column_type.name),
+                "data_type": data_column_type.data_type,
+            }
+            if data_column_type.data_type in ["int", "float"]:
+                out[key]["multiplier"] = value.get("multiplier", 1)
+                out[key]["addition"] = value.get("addition", 0)
+        return out
+
     def save(
         self, force_insert=False, force_update=False, using=None, update_fields=None
     ):
@@ -1394,6 +1438,8 @@ class ColumnMapping(UUIDModel, ResourceModelPermissionsMixin):
         except ColumnMapping.DoesNotExist:
             old_self = None
         update_files = old_self is not None and self.pk and self.map != old_self.map
+        # The map may have changed since missing_required_columns was cached
+        self.__dict__.pop("missing_required_columns", None)
         super(ColumnMapping, self).save(
             force_insert, force_update, using, update_fields
         )
@@ -1556,6 +1602,14 @@ class ObservedFile(
             ]
         )
 
+    def is_applicable_mapping(self, mapping) -> bool:
+        """
+        A mapping is only applicable if all of its keys are in the file's column names.
+        """
+        if not isinstance(self.summary, dict):
+            return False
+        return all(m in self.summary for m in mapping.map.keys())
+
     def applicable_mappings(self, request):
         """
         Return a list of applicable mappings for this file,
@@ -1567,11 +1621,17 @@ class ObservedFile(
         col_names = self.summary.keys()
         applicable_valid_mappings = []
         applicable_invalid_mappings = []
+        # Look the required columns up once rather than once per mapping
+        required_columns = list(
+            DataColumnType.objects.filter(is_required=True).values_list("pk", "name")
+        )
         for mapping in ColumnMapping.objects.all():
             mapping.has_object_read_permission(request)
-            # A mapping is only applicable if all of its keys are in the column names
-            if any([m not in col_names for m in mapping.map.keys()]):
+            if not self.is_applicable_mapping(mapping):
                 continue
+            mapping.missing_required_columns = mapping.get_missing_required_columns(
+                required_columns
+            )
             # Applicability is scored by the number of column names it matches
             matches = []
             for col in col_names:
@@ -1787,11 +1847,21 @@ class MonitoredPath(UUIDModel, ResourceModelPermissionsMixin):
         return self.path
 
     @staticmethod
-    def paths_match(parent: str, child: str, regex: str):
+    @functools.lru_cache(maxsize=4096)
+    def compile_regex(regex: str) -> re.Pattern:
+        """
+        Compile a path regex, reusing the compiled pattern for repeated regexes.
+        """
+        return re.compile(regex)
+
+    @staticmethod
+    def paths_match(parent: str, child: str, regex: str | re.Pattern):
         if not child.startswith(parent):
             return False
         if regex is not None:
-            return re.search(regex, os.path.relpath(child, parent)) is not None
+            if isinstance(regex, str):
+                regex = MonitoredPath.compile_regex(regex)
+            return regex.search(os.path.relpath(child, parent)) is not None
         return True
 
     def matches(self, path):
@@ -2054,6 +2124,49 @@ class ValidationSchema(CustomPropertiesModel, ResourceModelPermissionsMixin):
         return f"{self.name} [ValidationSchema {self.id}]"
 
 
+# Compiled validators keyed by (schema pk, target class name), least recently used first.
+# Each entry holds a copy of the schema it was compiled from, so a schema whose
+# content has changed (however it was edited) is recompiled.
+_VALIDATOR_CACHE_SIZE = 128
+_validator_cache = collections.OrderedDict()
+_validator_cache_lock = threading.Lock()
+
+
+def _get_validator(schema: ValidationSchema, class_name: str):
+    """
+    Return a validator checking an array of `class_name` objects against `schema`.
+    Validators are compiled once and reused until the schema's content changes.
+    """
+    key = (schema.pk, class_name)
+    with _validator_cache_lock:
+        cached = _validator_cache.get(key)
+        if cached is not None and cached[0] == schema.schema:
+            _validator_cache.move_to_end(key)
+            return cached[1]
+    # Create the schema to validate against by asserting we have type classname
+    s = {
+        **schema.schema,
+        "type": "array",
+        "items": {"$ref": f"#/$defs/{class_name}"},
+    }
+    cls = jsonschema.validators.validator_for(s)
+    cls.check_schema(s)
+    validator = cls(s)
+    with _validator_cache_lock:
+        _validator_cache[key] = (copy.deepcopy(schema.schema), validator)
+        _validator_cache.move_to_end(key)
+        while len(_validator_cache) > _VALIDATOR_CACHE_SIZE:
+            _validator_cache.popitem(last=False)
+    return validator
+
+
+@receiver(post_delete, sender=ValidationSchema)
+def _evict_validators(sender, instance, **kwargs):
+    with _validator_cache_lock:
+        for key in [k for k in _validator_cache if k[0] == instance.pk]:
+            del _validator_cache[key]
+
+
 class SchemaValidation(TimestampedModel):
     """
     Whether a component is valid according to a ValidationSchema.
@@ -2127,11 +2240,10 @@ class SchemaValidation(TimestampedModel):
             ).data
             d = data if isinstance(data, list) else [data]
             try:
-                # Create the schema to validate against by asserting we have type classname
-                s = self.schema.schema
-                s["type"] = "array"
-                s["items"] = {"$ref": f"#/$defs/{model_class.__name__}"}
-                jsonschema.validate(d, s)
+                validator = _get_validator(self.schema, model_class.__name__)
+                error = jsonschema.exceptions.best_match(validator.iter_errors(d))
+                if error is not None:
+                    raise error
                 self.status = ValidationStatus.VALID
                 self.detail = None
             except jsonschema.exceptions.ValidationError as e:
@@ -4,7 +4,14 @@
 
 from django.db.models import Q
 from dry_rest_permissions.generics import DRYPermissionFiltersBase
-from .models import UserLevel, Lab, Team, GroupProxy, get_user_auth_details
+from .models import (
+    UserLevel,
+    Lab,
+    Team,
+    GroupProxy,
+    ValidationSchema,
+    get_user_auth_details,
+)
 
 
 class HarvesterFilterBackend(DRYPermissionFiltersBase):
@@ -142,7 +149,8 @@ class SchemaValidationFilterBackend(ResourceFilterBackend):
     action_routing = True
 
     def filter_list_queryset(self, request, queryset, view):
-        schemas = {q.schema for q in queryset}
+        # Check each schema once, rather than loading it for every validation
+        schemas = ValidationSchema.objects.filter(pk__in=queryset.values("schema"))
         included_schemas = [s for s in schemas]
         for schema in schemas:
             if not schema.has_object_read_permission(request):
@@ -5,17 +5,20 @@ from __future__ import annotations
 
 import json
 import os.path
-from pathlib import Path
 import re
+import shutil
 import tempfile
 
 import jsonschema
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.files import File
+from django.core.files.base import ContentFile
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 from drf_spectacular.types import OpenApiTypes
 from galv_harvester.parse.exceptions import UnsupportedFileTypeError
-from rest_framework.reverse import reverse
 from drf_spectacular.utils import (
     extend_schema_field,
     extend_schema_serializer,
@@ -78,10 +81,11 @@ from django.conf.global_settings import DATA_UPLOAD_MAX_MEMORY_SIZE
 from rest_framework import serializers
 from knox.models import AuthToken
 
-from galv_harvester.harvest import InternalHarvestProcessor
-
 from .utils import (
+    CachedFieldsMixin,
+    EagerLoadingMixin,
     CustomPropertiesModelSerializer,
+    HyperlinkedIdModelSerializer,
     GetOrCreateTextField,
     augment_extra_kwargs,
     url_help_text,
@@ -91,6 +95,7 @@ from .utils import (
     CreateOnlyMixin,
     ValidationPresentationMixin,
     PasswordField,
+    reverse_object_url,
 )
 
 import logging
@@ -98,6 +103,19 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Column data types whose values can be scaled by a ColumnMapping
+_NUMERIC_COLUMN_TYPES = {"int": int, "float": float}
+
+# Harvester environment variable names
+_is_env_key = re.compile(r"[a-zA-Z0-9_]+").fullmatch
+
+
+def _validate_password_length(value):
+    if len(value) < 8:
+        raise ValidationError("Password must be at least 8 characters")
+    return value
+
+
 @extend_schema_serializer(
     examples=[
         OpenApiExample(
@@ -129,7 +147,7 @@ logger = logging.getLogger(__name__)
         ),
     ]
 )
-class UserSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
+class UserSerializer(CachedFieldsMixin, HyperlinkedIdModelSerializer, PermissionsMixin):
     current_password = serializers.CharField(
         write_only=True,
         allow_blank=True,
@@ -140,6 +158,9 @@ class UserSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
     is_lab_admin = serializers.SerializerMethodField()
 
     def get_is_lab_admin(self, instance) -> bool:
+        # UserViewSet annotates this; users fetched elsewhere need a query
+        if hasattr(instance, "is_lab_admin"):
+            return instance.is_lab_admin
         return instance.groups.filter(editable_lab__isnull=False).exists()
 
     def validate_email(self, value):
@@ -149,15 +170,15 @@ class UserSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
             raise ValidationError("Email address is already in use")
         return value
 
-    @staticmethod
-    def validate_password(value):
-        if len(value) < 8:
-            raise ValidationError("Password must be at least 8 characters")
-        return value
+    validate_password = staticmethod(_validate_password_length)
 
     def validate(self, attrs):
         current_password = attrs.pop("current_password", None)
-        if self.instance and not self.instance.check_password(current_password):
+        if self.instance and (
+            # check_password(None) would still run a dummy hash before failing
+            current_password is None
+            or not self.instance.check_password(current_password)
+        ):
             raise ValidationError("Current password is incorrect")
         return attrs
 
@@ -216,10 +237,7 @@ class PasswordResetSerializer(serializers.Serializer):
     token = serializers.CharField(help_text="Token from password reset email")
     password = serializers.CharField(help_text="New password (8 characters minimum)")
 
-    def validate_password(self, value):
-        if len(value) < 8:
-            raise ValidationError("Password must be at least 8 characters")
-        return value
+    validate_password = staticmethod(_validate_password_length)
 
     def validate(self, attrs):
         try:
@@ -232,13 +250,16 @@ class PasswordResetSerializer(serializers.Serializer):
             raise ValidationError("Invalid token")
         if token.expired:
             raise ValidationError("Token has expired")
+        # Keep the looked-up user and token for reset()
+        self._user = user
+        self._token = token
         return attrs
 
     def reset(self, validated_data):
-        user = UserProxy.objects.get(email=validated_data["email"])
-        user.set_password(validated_data["password"])
-        user.save()
-        PasswordReset.objects.filter(user=user).delete()
+        self._user.set_password(validated_data["password"])
+        self._user.save()
+        # PasswordReset is one-to-one with the user, so this is the only token
+        self._token.delete()
         return {"success": True}
 
 
@@ -254,12 +275,13 @@ class PasswordResetSerializer(serializers.Serializer):
     ]
 )
 class TransparentGroupSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin
+    CachedFieldsMixin, HyperlinkedIdModelSerializer, PermissionsMixin
 ):
     users = TruncatedUserHyperlinkedRelatedIdField(
         UserSerializer,
         ["url", "id", "username", "first_name", "last_name", "permissions"],
         view_name="userproxy-detail",
+        # Only active users can be added to groups
         queryset=UserProxy.objects.filter(is_active=True),
         read_only=False,
         source="user_set",
@@ -267,11 +289,6 @@ class TransparentGroupSerializer(
         help_text="Users in the group",
     )
 
-    @staticmethod
-    def validate_users(value):
-        # Only active users can be added to groups
-        return [u for u in value if u.is_active]
-
     def update(self, instance, validated_data):
         if "user_set" in validated_data:
             # Check there will be at least one user left for lab admin groups
@@ -289,7 +306,12 @@ class TransparentGroupSerializer(
 
     def to_internal_value(self, data):
         if isinstance(data, list):
-            return super().to_internal_value({"users": data})
+            # Validate the users field directly rather than wrapping the list
+            # in a dict and running the full Serializer.to_internal_value
+            try:
+                return {"user_set": self.fields["users"].run_validation(data)}
+            except ValidationError as e:
+                raise ValidationError({"users": e.detail})
         return super().to_internal_value(data)
 
     class Meta:
@@ -369,7 +391,7 @@ class TransparentGroupSerializer(
         ),
     ]
 )
-class TeamSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
+class TeamSerializer(CachedFieldsMixin, HyperlinkedIdModelSerializer, PermissionsMixin):
     member_group = TransparentGroupSerializer(
         required=False, help_text="Members of this Team"
     )
@@ -456,11 +478,11 @@ class TeamSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
         """
         Only lab admins can create teams in their lab
         """
-        try:
-            assert (
-                value.pk in self.context["request"].user_auth_details.writeable_lab_ids
-            )
-        except BaseException:
+        request = self.context.get("request")
+        if (
+            request is None
+            or value.pk not in get_user_auth_details(request).writeable_lab_ids
+        ):
             raise ValidationError("You may only create Teams in your own lab(s)")
         return value
 
@@ -475,8 +497,9 @@ class TeamSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
                     "No admins specified and no request context available to determine user."
                 )
         team = super().create(validated_data)
-        TransparentGroupSerializer().update(team.admin_group, admin_group)
-        TransparentGroupSerializer().update(team.member_group, member_group)
+        group_serializer = TransparentGroupSerializer()
+        group_serializer.update(team.admin_group, admin_group)
+        group_serializer.update(team.member_group, member_group)
         team.save()
         return team
 
@@ -484,12 +507,13 @@ class TeamSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
         """
         Pass group updates to the group serializer
         """
+        group_serializer = TransparentGroupSerializer()
         if "admin_group" in validated_data:
             admin_group = validated_data.pop("admin_group")
-            TransparentGroupSerializer().update(instance.admin_group, admin_group)
+            group_serializer.update(instance.admin_group, admin_group)
         if "member_group" in validated_data:
             member_group = validated_data.pop("member_group")
-            TransparentGroupSerializer().update(instance.member_group, member_group)
+            group_serializer.update(instance.member_group, member_group)
         return super().update(instance, validated_data)
 
     class Meta:
@@ -540,7 +564,7 @@ class TeamSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
     ]
 )
 class GalvStorageTypeSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin
+    CachedFieldsMixin, HyperlinkedIdModelSerializer, PermissionsMixin
 ):
     bytes_used = serializers.SerializerMethodField()
 
@@ -591,7 +615,10 @@ class GalvStorageTypeSerializer(
     ]
 )
 class AdditionalS3StorageTypeSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin, CreateOnlyMixin
+    CachedFieldsMixin,
+    HyperlinkedIdModelSerializer,
+    PermissionsMixin,
+    CreateOnlyMixin,
 ):
     bytes_used = serializers.SerializerMethodField()
     secret_key = PasswordField(help_text="Secret key for S3 storage")
@@ -608,6 +635,10 @@ class AdditionalS3StorageTypeSerializer(
         create_only=True,
     )
 
+    def get_fields_cache_key(self):
+        # CreateOnlyMixin marks create_only fields read-only outside of 'create'
+        return "view" in self.context and self.context["view"].action == "create"
+
     def get_bytes_used(self, instance) -> int:
         return instance.get_bytes_used()
 
@@ -615,11 +646,11 @@ class AdditionalS3StorageTypeSerializer(
         """
         Only lab admins can create teams in their lab
         """
-        try:
-            assert (
-                value.pk in self.context["request"].user_auth_details.writeable_lab_ids
-            )
-        except BaseException:
+        request = self.context.get("request")
+        if (
+            request is None
+            or value.pk not in get_user_auth_details(request).writeable_lab_ids
+        ):
             raise ValidationError("You may only create Storages in your own lab(s)")
         return value
 
@@ -697,7 +728,7 @@ class AdditionalS3StorageTypeSerializer(
         ),
     ]
 )
-class LabSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
+class LabSerializer(CachedFieldsMixin, HyperlinkedIdModelSerializer, PermissionsMixin):
     admin_group = TransparentGroupSerializer(
         help_text="Group of users who can edit this Lab"
     )
@@ -712,14 +743,15 @@ class LabSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
     storages = serializers.SerializerMethodField()
 
     def get_storages(self, instance) -> list[str]:
-        from ..views import get_storage_url
+        from ..views import get_storage_view_name
 
-        storages = instance.get_all_storage_types()
         return [
-            get_storage_url(
-                s._meta.model, "detail", args=[s.pk], request=self.context["request"]
+            reverse_object_url(
+                get_storage_view_name(s._meta.model, "detail"),
+                s.pk,
+                self.context["request"],
             )
-            for s in storages
+            for s in instance.get_all_storage_types()
         ]
 
     def create(self, validated_data):
@@ -757,6 +789,25 @@ class LabSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
         read_only_fields = ["url", "id", "teams", "harvesters", "permissions"]
 
 
+def _allowed_level_values(levels):
+    """
+    Return the allowed access level values as a set, and as they appear in error messages.
+    """
+    values = [v.value for v in levels]
+    return frozenset(values), str(values)
+
+
+_ALLOWED_READ_VALUES = _allowed_level_values(ALLOWED_USER_LEVELS_READ)
+_ALLOWED_EDIT_VALUES = _allowed_level_values(ALLOWED_USER_LEVELS_EDIT)
+_ALLOWED_DELETE_VALUES = _allowed_level_values(ALLOWED_USER_LEVELS_DELETE)
+
+# Access level choices, shared by every serializer declaring an access level field
+_READ_CHOICES = tuple((v.value, v.label) for v in ALLOWED_USER_LEVELS_READ)
+_EDIT_CHOICES = tuple((v.value, v.label) for v in ALLOWED_USER_LEVELS_EDIT)
+_DELETE_CHOICES = tuple((v.value, v.label) for v in ALLOWED_USER_LEVELS_DELETE)
+_EDIT_PATH_CHOICES = tuple((v.value, v.label) for v in ALLOWED_USER_LEVELS_EDIT_PATH)
+
+
 class WithTeamMixin(serializers.Serializer):
     team = TruncatedHyperlinkedRelatedIdField(
         "TeamSerializer",
@@ -768,90 +819,73 @@ class WithTeamMixin(serializers.Serializer):
         allow_null=True,
     )
     read_access_level = serializers.ChoiceField(
-        choices=[(v.value, v.label) for v in ALLOWED_USER_LEVELS_READ],
+        choices=_READ_CHOICES,
         help_text="Minimum user level required to read this resource",
         allow_null=True,
         default=UserLevel.LAB_MEMBER.value,
     )
     edit_access_level = serializers.ChoiceField(
-        choices=[(v.value, v.label) for v in ALLOWED_USER_LEVELS_EDIT],
+        choices=_EDIT_CHOICES,
         help_text="Minimum user level required to edit this resource",
         allow_null=True,
         default=UserLevel.TEAM_MEMBER.value,
     )
     delete_access_level = serializers.ChoiceField(
-        choices=[(v.value, v.label) for v in ALLOWED_USER_LEVELS_DELETE],
+        choices=_DELETE_CHOICES,
         help_text="Minimum user level required to create this resource",
         allow_null=True,
         default=UserLevel.TEAM_MEMBER.value,
     )
 
+    _default_team = None
+
     def validate_team(self, value):
         """
         Only team members can create resources in their team.
         If a resource is being moved from one team to another, the user must be a member of both teams.
         """
-        try:
-            teams = Team.objects.filter(
-                pk__in=self.context["request"].user_auth_details.team_ids
-            )
-            if value is None:
-                if len(teams) == 1:
-                    value = teams[0]
-                else:
-                    raise ValidationError(
-                        "You must specify a team because you are a member of multiple teams"
-                    )
-            else:
-                assert value in teams
-        except KeyError:
+        if "request" not in self.context:
             raise ValidationError(
                 "No request context available to determine user's teams"
             )
-        except BaseException:
+        team_ids = get_user_auth_details(self.context["request"]).team_ids
+        if value is None and len(team_ids) == 1:
+            # Remember the default team so bulk writes (one child serializer
+            # validating many items) only look it up once
+            if self._default_team is None:
+                self._default_team = Team.objects.get(pk=next(iter(team_ids)))
+            value = self._default_team
+        if value is None or value.pk not in team_ids:
             raise ValidationError(
                 "You may only create resources in your own team(s)",
                 code=HTTP_403_FORBIDDEN,
             )
-        if self.instance is not None:
-            try:
-                assert self.instance.team in teams
-            except BaseException:
-                raise ValidationError("You may only edit resources in your own team(s)")
-        else:
-            assert value is not None
+        if self.instance is not None and self.instance.team_id not in team_ids:
+            raise ValidationError("You may only edit resources in your own team(s)")
         return value
 
     def validate_access_level(self, value, allowed_values):
+        values, expected = allowed_values
         try:
             v = UserLevel(value)
         except ValueError:
             raise ValidationError(
-                (
-                    f"Invalid access level '{value}'. "
-                    f"Expected one of {[v.value for v in allowed_values]}"
-                )
+                f"Invalid access level '{value}'. Expected one of {expected}"
+            )
+        if self.instance is not None and v.value not in values:
+            raise ValidationError(
+                f"Invalid read access level '{value}'. Expected one of {expected}"
             )
-        if self.instance is not None:
-            try:
-                assert v in allowed_values
-            except BaseException:
-                raise ValidationError(
-                    (
-                        f"Invalid read access level '{value}'. "
-                        f"Expected one of {[v.value for v in allowed_values]}"
-                    )
-                )
         return v.value
 
     def validate_read_access_level(self, value):
-        return self.validate_access_level(value, ALLOWED_USER_LEVELS_READ)
+        return self.validate_access_level(value, _ALLOWED_READ_VALUES)
 
     def validate_edit_access_level(self, value):
-        return self.validate_access_level(value, ALLOWED_USER_LEVELS_EDIT)
+        return self.validate_access_level(value, _ALLOWED_EDIT_VALUES)
 
     def validate_delete_access_level(self, value):
-        return self.validate_access_level(value, ALLOWED_USER_LEVELS_DELETE)
+        return self.validate_access_level(value, _ALLOWED_DELETE_VALUES)
 
     def validate(self, attrs):
         """
@@ -888,27 +922,20 @@ class WithTeamMixin(serializers.Serializer):
                     raise ValidationError(
                         "You may only change delete access levels if you are a team admin"
                     )
-        if "read_access_level" in attrs:
-            edit_level = attrs.get(
-                "edit_access_level",
-                self.instance.edit_access_level
-                if self.instance
-                else UserLevel.TEAM_ADMIN.value,
-            )
-            if attrs["read_access_level"] > edit_level:
-                raise ValidationError(
-                    "Read access level must be less than or equal to edit access level"
-                )
-        if "edit_access_level" in attrs:
-            delete_level = attrs.get(
-                "delete_access_level",
-                self.instance.delete_access_level
+        # Changed levels must not exceed the (new or current) level above them
+        for lower, higher in (("read", "edit"), ("edit", "delete")):
+            if f"{lower}_access_level" not in attrs:
+                continue
+            lower_level = attrs[f"{lower}_access_level"]
+            higher_level = attrs.get(
+                f"{higher}_access_level",
+                getattr(self.instance, f"{higher}_access_level")
                 if self.instance
                 else UserLevel.TEAM_ADMIN.value,
             )
-            if attrs["edit_access_level"] > delete_level:
+            if lower_level > higher_level:
                 raise ValidationError(
-                    "Edit access level must be less than or equal to delete access level"
+                    f"{lower.capitalize()} access level must be less than or equal to {higher} access level"
                 )
         return attrs
 
@@ -942,6 +969,7 @@ class WithTeamMixin(serializers.Serializer):
     ]
 )
 class CellSerializer(
+    EagerLoadingMixin,
     CustomPropertiesModelSerializer,
     PermissionsMixin,
     WithTeamMixin,
@@ -1022,7 +1050,7 @@ class CellSerializer(
     ]
 )
 class CellFamilySerializer(
-    CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
+    EagerLoadingMixin, CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
 ):
     manufacturer = GetOrCreateTextField(
         foreign_model=CellManufacturers, help_text="Manufacturer name"
@@ -1101,7 +1129,7 @@ class CellFamilySerializer(
     ]
 )
 class EquipmentFamilySerializer(
-    CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
+    EagerLoadingMixin, CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
 ):
     type = GetOrCreateTextField(
         foreign_model=EquipmentTypes, help_text="Equipment type"
@@ -1170,6 +1198,7 @@ class EquipmentFamilySerializer(
     ]
 )
 class EquipmentSerializer(
+    EagerLoadingMixin,
     CustomPropertiesModelSerializer,
     PermissionsMixin,
     WithTeamMixin,
@@ -1260,7 +1289,7 @@ class EquipmentSerializer(
     ]
 )
 class ScheduleFamilySerializer(
-    CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
+    EagerLoadingMixin, CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
 ):
     identifier = GetOrCreateTextField(foreign_model=ScheduleIdentifiers)
     schedules = TruncatedHyperlinkedRelatedIdField(
@@ -1330,6 +1359,7 @@ class ScheduleFamilySerializer(
     ]
 )
 class ScheduleSerializer(
+    EagerLoadingMixin,
     CustomPropertiesModelSerializer,
     PermissionsMixin,
     WithTeamMixin,
@@ -1359,10 +1389,13 @@ class ScheduleSerializer(
             )
         if value is None:
             return value
-        keys = self.instance.family.pybamm_template_variable_names()
+        keys = frozenset(self.instance.family.pybamm_template_variable_names())
         for k, v in value.items():
             if k not in keys:
                 raise ValidationError(f"Schedule variable {k} is not in the template")
+            # JSON numbers arrive as int/float already; only other values need converting
+            if isinstance(v, (int, float)):
+                continue
             try:
                 float(v)
             except (ValueError, TypeError):
@@ -1440,7 +1473,7 @@ class ScheduleSerializer(
     ]
 )
 class CyclerTestSerializer(
-    CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
+    EagerLoadingMixin, CustomPropertiesModelSerializer, PermissionsMixin, WithTeamMixin
 ):
     rendered_schedule = serializers.SerializerMethodField(help_text="Rendered schedule")
     schedule = TruncatedHyperlinkedRelatedIdField(
@@ -1469,7 +1502,8 @@ class CyclerTestSerializer(
         "ObservedFileSerializer",
         ["name", "path", "parquet_partitions", "png"],
         "observedfile-detail",
-        queryset=ObservedFile.objects.all(),
+        # Files are only linked here, so their (potentially large) metadata is never read
+        queryset=ObservedFile.objects.defer("core_metadata", "extra_metadata"),
         many=True,
         allow_null=True,
         allow_empty=True,
@@ -1477,16 +1511,30 @@ class CyclerTestSerializer(
     )
 
     def get_rendered_schedule(self, instance) -> list[str] | None:
-        if instance.schedule is None:
+        # Rendering is expensive, so list views only do it when asked with ?include=rendered_schedule
+        view = self.context.get("view")
+        if view and view.action == "list":
+            include = self.context["request"].query_params.get("include", "")
+            if "rendered_schedule" not in include.split(","):
+                return None
+        if instance.schedule_id is None:
             return None
+        # Reuse the schedule rendered by validate() when responding to a create/update
+        validated = getattr(self, "_validated_render", None)
+        if validated is not None and validated[:2] == (
+            instance.schedule_id,
+            instance.cell_id,
+        ):
+            return validated[2]
         return instance.rendered_pybamm_schedule(False)
 
     def validate(self, data):
         if data.get("schedule") is not None:
             try:
-                render_pybamm_schedule(data["schedule"], data["cell"])
+                rendered = render_pybamm_schedule(data["schedule"], data["cell"])
             except ScheduleRenderError as e:
                 raise ValidationError(e)
+            self._validated_render = (data["schedule"].pk, data["cell"].pk, rendered)
         return data
 
     class Meta:
@@ -1535,7 +1583,9 @@ class CyclerTestSerializer(
         ),
     ]
 )
-class HarvesterSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
+class HarvesterSerializer(
+    EagerLoadingMixin, HyperlinkedIdModelSerializer, PermissionsMixin
+):
     lab = TruncatedHyperlinkedRelatedIdField(
         "LabSerializer",
         ["name"],
@@ -1555,32 +1605,45 @@ class HarvesterSerializer(serializers.HyperlinkedModelSerializer, PermissionsMix
         # representation for python object
         def to_internal_value(self, values):
             for k in values.keys():
-                if not re.match(r"^[a-zA-Z0-9_]+$", k):
+                if not _is_env_key(k):
                     raise ValidationError(f"Key {k} is not alpha_numeric")
+            harvester = self.root.instance
+            # Diff against the stored variables in Python and write the changes in bulk
+            existing = {}
+            for env in HarvesterEnvVar.objects.filter(harvester=harvester):
+                existing.setdefault(env.key, []).append(env)
+            input_keys = set()
+            created = {}
             for k, v in values.items():
                 k = k.upper()
-                try:
-                    env = HarvesterEnvVar.objects.get(
-                        harvester=self.root.instance, key=k
-                    )
-                    env.value = v
-                    env.deleted = False
-                    env.save()
-                except HarvesterEnvVar.DoesNotExist:
-                    HarvesterEnvVar.objects.create(
-                        harvester=self.root.instance, key=k, value=v
-                    )
-            envvars = HarvesterEnvVar.objects.filter(
-                harvester=self.root.instance, deleted=False
-            )
-            input_keys = [k.upper() for k in values.keys()]
-            for v in envvars.all():
-                if v.key not in input_keys:
-                    v.deleted = True
-                    v.save()
-            return HarvesterEnvVar.objects.filter(
-                harvester=self.root.instance, deleted=False
+                input_keys.add(k)
+                if k in existing:
+                    for env in existing[k]:
+                        env.value = v
+                        env.deleted = False
+                else:
+                    created[k] = HarvesterEnvVar(harvester=harvester, key=k, value=v)
+            now = timezone.now()
+            updated = []
+            for k, envs in existing.items():
+                for env in envs:
+                    if k in input_keys:
+                        updated.append(env)
+                    elif not env.deleted:
+                        env.deleted = True
+                        updated.append(env)
+                    else:
+                        continue
+                    # bulk_update skips save(), so bump the auto_now timestamp by hand
+                    env.modified = now
+            HarvesterEnvVar.objects.bulk_update(
+                updated, ["value", "deleted", "modified"]
             )
+            HarvesterEnvVar.objects.bulk_create(created.values())
+            return [
+                *[env for envs in existing.values() for env in envs if not env.deleted],
+                *created.values(),
+            ]
 
     environment_variables = EnvField(
         help_text="Environment variables set on this Harvester"
@@ -1653,14 +1716,15 @@ class HarvesterSerializer(serializers.HyperlinkedModelSerializer, PermissionsMix
     ]
 )
 class MonitoredPathSerializer(
-    serializers.HyperlinkedModelSerializer,
+    EagerLoadingMixin,
+    HyperlinkedIdModelSerializer,
     PermissionsMixin,
     WithTeamMixin,
     CreateOnlyMixin,
 ):
     files = serializers.SerializerMethodField(help_text="Files on this MonitoredPath")
     edit_access_level = serializers.ChoiceField(
-        choices=[(v.value, v.label) for v in ALLOWED_USER_LEVELS_EDIT_PATH],
+        choices=_EDIT_PATH_CHOICES,
         help_text="Minimum user level required to edit this resource",
         allow_null=True,
         required=False,
@@ -1668,14 +1732,24 @@ class MonitoredPathSerializer(
 
     def get_files(self, instance) -> list[OpenApiTypes.URI]:
         """Return only URLs because otherwise it takes _forever_."""
-        files = ObservedFile.objects.filter(harvester=instance.harvester).values(
-            "path", "id"
+        # List views serialize many paths per harvester, so share one file query per harvester
+        files_by_harvester = self.context.setdefault("files_by_harvester", {})
+        if instance.harvester_id not in files_by_harvester:
+            files_by_harvester[instance.harvester_id] = list(
+                ObservedFile.objects.filter(
+                    harvester_id=instance.harvester_id
+                ).values_list("path", "id")
+            )
+        regex = (
+            MonitoredPath.compile_regex(instance.regex)
+            if instance.regex is not None
+            else None
         )
-        file_urls = []
-        for file in files:
-            if instance.matches(file.get("path")):
-                file_urls.append(reverse("observedfile-detail", (file.get("id"),)))
-        return file_urls
+        return [
+            reverse_object_url("observedfile-detail", pk)
+            for path, pk in files_by_harvester[instance.harvester_id]
+            if MonitoredPath.paths_match(instance.path, path, regex)
+        ]
 
     harvester = TruncatedHyperlinkedRelatedIdField(
         "HarvesterSerializer",
@@ -1699,7 +1773,7 @@ class MonitoredPathSerializer(
         if self.instance is not None:
             return self.instance.harvester  # harvester cannot be changed
         request = self.context["request"]
-        if value.lab.pk not in get_user_auth_details(request).lab_ids:
+        if value.lab_id not in get_user_auth_details(request).lab_ids:
             raise ValidationError(
                 "You may only create MonitoredPaths on Harvesters in your own lab(s)"
             )
@@ -1713,7 +1787,10 @@ class MonitoredPathSerializer(
         """
         if self.instance is not None:
             return self.instance.team
-        if value.pk not in self.context["request"].user_auth_details.writeable_team_ids:
+        if (
+            value.pk
+            not in get_user_auth_details(self.context["request"]).writeable_team_ids
+        ):
             raise ValidationError(
                 "You may only create MonitoredPaths in your own team(s)",
                 code=HTTP_403_FORBIDDEN,
@@ -1722,7 +1799,7 @@ class MonitoredPathSerializer(
 
     def validate_path(self, value):
         try:
-            value = str(value).lstrip().rstrip()
+            value = str(value).strip()
         except BaseException as e:
             raise ValidationError(f"Invalid path: {e.__context__}")
         abs_path = os.path.normpath(value)
@@ -1740,7 +1817,7 @@ class MonitoredPathSerializer(
 
     def validate_regex(self, value):
         try:
-            re.compile(value)
+            MonitoredPath.compile_regex(value)
             return value
         except BaseException as e:
             raise ValidationError(f"Invalid regex: {e.__context__}")
@@ -1770,22 +1847,12 @@ class MonitoredPathSerializer(
 
 
 class ColumnMappingSerializer(
-    serializers.HyperlinkedModelSerializer, WithTeamMixin, PermissionsMixin
+    CachedFieldsMixin, HyperlinkedIdModelSerializer, WithTeamMixin, PermissionsMixin
 ):
     rendered_map = serializers.SerializerMethodField()
 
     def get_rendered_map(self, instance) -> dict:
-        out = {}
-        for key, value in instance.map.items():
-            data_column_type = DataColumnType.objects.get(pk=value["column_type"])
-            out[key] = {
-                "new_name": value.get("new_name", data_column_type.name),
-                "data_type": data_column_type.data_type,
-            }
-            if data_column_type.data_type in ["int", "float"]:
-                out[key]["multiplier"] = value.get("multiplier", 1)
-                out[key]["addition"] = value.get("addition", 0)
-        return out
+        return instance.rendered_map
 
     def validate_map(self, value):
         """
@@ -1810,22 +1877,33 @@ class ColumnMappingSerializer(
         """
         if not isinstance(value, dict):
             raise ValidationError("Map must be a dictionary")
-        required_column_ids = [
-            c.pk for c in DataColumnType.objects.filter(is_required=True)
-        ]
+
+        # Fetch every referenced column type in one query
+        def to_pk(column_type_id):
+            try:
+                return DataColumnType._meta.pk.to_python(column_type_id)
+            except DjangoValidationError:
+                return None
+
+        column_type_pks = {
+            k: to_pk(v.get("column_type"))
+            for k, v in value.items()
+            if isinstance(v, dict)
+        }
+        column_types = DataColumnType.objects.in_bulk(
+            {pk for pk in column_type_pks.values() if pk is not None}
+        )
         required_columns_supplied = {}
         new_value = {}
         for k, v in value.items():
-            new_value[k] = v
             if not isinstance(k, str):
                 raise ValidationError(
                     "Keys must be strings representing the names of columns in the file"
                 )
             if not isinstance(v, dict):
                 raise ValidationError("Values must be dictionaries")
-            try:
-                column_type = DataColumnType.objects.get(pk=v.get("column_type"))
-            except DataColumnType.DoesNotExist:
+            column_type = column_types.get(column_type_pks[k])
+            if column_type is None:
                 if v.get("column_type") is None:
                     raise ValidationError(
                         f"No column_type specified for column '{k}' - perhaps you should use Unknown"
@@ -1833,8 +1911,8 @@ class ColumnMappingSerializer(
                 raise ValidationError(
                     f"Invalid column_type id '{v.get('column_type')}' for column '{k}'"
                 )
-            if column_type.pk in required_column_ids:
-                if column_type.pk in required_columns_supplied.keys():
+            if column_type.is_required:
+                if column_type.pk in required_columns_supplied:
                     raise ValidationError(
                         f"Cannot assign column '{k}' to required column {column_type.name}. "
                         f"Column {column_type.name} is already assigned to column '{required_columns_supplied[column_type.pk]}'"
@@ -1847,35 +1925,41 @@ class ColumnMappingSerializer(
                     )
                 if not isinstance(v["new_name"], str):
                     raise ValidationError(f"new_name for column '{k}' must be a string")
-            if column_type.data_type in ["int", "float"]:
-                type_fn = int if column_type.data_type == "int" else float
+            type_fn = _NUMERIC_COLUMN_TYPES.get(column_type.data_type)
+            if type_fn is not None:
+                # Copy rather than fill in the defaults on the caller's dict
                 try:
-                    new_value[k]["multiplier"] = type_fn(v.get("multiplier", 1))
-                    new_value[k]["addition"] = type_fn(v.get("addition", 0))
+                    new_value[k] = {
+                        **v,
+                        "multiplier": type_fn(v.get("multiplier", 1)),
+                        "addition": type_fn(v.get("addition", 0)),
+                    }
                 except (ValueError, TypeError) as e:
                     raise ValidationError(
                         f"Multiplier and addition for column '{k}' must be {column_type.data_type}"
                     ) from e
-            elif "multiplier" in v:
+                continue
+            if "multiplier" in v:
                 raise ValidationError(
                     f"Column '{k}' is not numerical, so it cannot have a multiplier"
                 )
-            elif "addition" in v:
+            if "addition" in v:
                 raise ValidationError(
                     f"Column '{k}' is not numerical, so it cannot have an addition"
                 )
+            new_value[k] = v
         return new_value
 
     def validate(self, attrs):
+        # A mapping with no files passes trivially, so no separate in_use query is needed
         if (
             self.instance
             and self.instance.map != attrs["map"]
-            and self.instance.in_use
             and not all(
-                [
-                    f.has_object_write_permission(request=self.context["request"])
-                    for f in self.instance.observed_files.all()
-                ]
+                f.has_object_write_permission(request=self.context["request"])
+                for f in self.instance.observed_files.select_related(
+                    "team", "harvester"
+                ).prefetch_related("monitored_paths__team")
             )
         ):
             raise ValidationError(
@@ -1911,7 +1995,7 @@ class ColumnMappingSerializer(
 
 
 class ParquetPartitionSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin
+    CachedFieldsMixin, HyperlinkedIdModelSerializer, PermissionsMixin
 ):
     observed_file = TruncatedHyperlinkedRelatedIdField(
         "ObservedFileSerializer",
@@ -2027,7 +2111,11 @@ class ParquetPartitionSerializer(
     ]
 )
 class ObservedFileSerializer(
-    serializers.HyperlinkedModelSerializer, WithTeamMixin, PermissionsMixin
+    EagerLoadingMixin,
+    CachedFieldsMixin,
+    HyperlinkedIdModelSerializer,
+    WithTeamMixin,
+    PermissionsMixin,
 ):
     parquet_partitions = TruncatedHyperlinkedRelatedIdField(
         "ParquetPartitionSerializer",
@@ -2062,24 +2150,18 @@ class ObservedFileSerializer(
     )
 
     def get_applicable_mappings(self, instance):
-        return reverse(
-            "observedfile-applicable-mappings",
-            args=[instance.pk],
-            request=self.context.get("request"),
+        return reverse_object_url(
+            "observedfile-applicable-mappings", instance.pk, self.context.get("request")
         )
 
     def get_extra_metadata(self, instance):
-        return reverse(
-            "observedfile-extra-metadata",
-            args=[instance.pk],
-            request=self.context.get("request"),
+        return reverse_object_url(
+            "observedfile-extra-metadata", instance.pk, self.context.get("request")
         )
 
     def get_summary(self, instance):
-        return reverse(
-            "observedfile-summary",
-            args=[instance.pk],
-            request=self.context.get("request"),
+        return reverse_object_url(
+            "observedfile-summary", instance.pk, self.context.get("request")
         )
 
     class Meta:
@@ -2112,7 +2194,7 @@ class ObservedFileSerializer(
             "edit_access_level",
             "delete_access_level",
         ]
-        read_only_fields = list(set(fields) - {"name", "mapping"})
+        read_only_fields = [f for f in fields if f not in ("name", "mapping")]
         extra_kwargs = augment_extra_kwargs(
             {"upload_errors": {"help_text": "Errors associated with this File"}}
         )
@@ -2206,12 +2288,6 @@ class ObservedFileCreateSerializer(ObservedFileSerializer, WithTeamMixin):
                 )
         return super().validate(attrs)
 
-    def to_representation(self, instance):
-        return super().to_representation(instance)
-
-    def save(self, **kwargs):
-        return super().save(**kwargs)
-
     def create(self, validated_data):
         """
         Create an ObservedFile from a file upload.
@@ -2225,6 +2301,9 @@ class ObservedFileCreateSerializer(ObservedFileSerializer, WithTeamMixin):
         it's less of a headache than trying to create persistent temporary storage somewhere
         and police the limits on it.
         """
+        # Imported here because the harvester pulls in dask/pandas,
+        # which workers shouldn't load until they actually process an upload
+        from galv_harvester.harvest import InternalHarvestProcessor
 
         def df_to_dict(df) -> dict:
             return json.loads(df.to_json())
@@ -2238,8 +2317,8 @@ class ObservedFileCreateSerializer(ObservedFileSerializer, WithTeamMixin):
         except IndexError:
             ext = ""
         with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
-            for chunk in file.chunks():
-                temp_file.write(chunk)
+            file.seek(0)
+            shutil.copyfileobj(file, temp_file, 1024 * 1024)
         try:
             harvester = InternalHarvestProcessor(temp_file.name)
             summary = harvester.summarise_columns()
@@ -2281,55 +2360,91 @@ class ObservedFileCreateSerializer(ObservedFileSerializer, WithTeamMixin):
                 logger.debug(
                     f"New manual file upload {'with' if mapping is not None else 'without'} mapping"
                 )
-                observed_file = ObservedFile.objects.create(
+                observed_file = ObservedFile(
                     **validated_data,
                     summary=summary,
                     parser=harvester.input_file.__class__.__name__,
                 )
             if mapping is not None:
-                if mapping not in [
-                    m["mapping"]
-                    for m in observed_file.applicable_mappings(self.context["request"])
-                ]:
+                # Check the chosen mapping alone rather than scoring every mapping
+                if not observed_file.is_applicable_mapping(mapping):
                     raise ValidationError("Mapping is not applicable to this file")
-                observed_file.mapping = mapping
-                observed_file.save()
-                # Apply mapping and save the file contents
-                harvester.mapping = ColumnMappingSerializer(
-                    mapping, context=self.context
-                ).data.get("rendered_map")
+                # Apply mapping to the file contents
+                harvester.mapping = mapping.rendered_map
                 harvester.process_data()
-                # Delete any existing partitions
-                observed_file.parquet_partitions.all().delete()
-                # Save parquet partitions to storage
-                d, _, partitions = list(os.walk(harvester.data_file_name))[0]
-                for i, name in enumerate([os.path.join(d, p) for p in partitions]):
-                    if name.endswith(".parquet"):
-                        ParquetPartition.objects.create(
-                            observed_file=observed_file,
-                            partition_number=i,
-                            bytes_required=Path(name).stat().st_size,
-                            parquet_file=File(
-                                file=open(name, "rb"), name=os.path.basename(name)
-                            ),
+            # Parsing is done, so the database writes can share one short transaction.
+            # Files written to storage aren't rolled back with it, so track them
+            # and remove them ourselves if the transaction fails.
+            partitions_written = []
+            png_written = False
+            try:
+                with transaction.atomic():
+                    if target_file is not None:
+                        # Lock the file so concurrent re-uploads can't interleave partitions
+                        observed_file = ObservedFile.objects.select_for_update().get(
+                            pk=target_file.pk
                         )
-                try:
-                    observed_file.png = File(
-                        file=open(harvester.png_file_name, "rb"),
-                        name=os.path.basename(harvester.png_file_name),
-                    )
-                except (
-                    FileNotFoundError
-                ):  # don't fail the whole process if the PNG can't be saved
-                    logger.exception("Error saving PNG")
-                    pass
-                observed_file.state = FileState.IMPORTED
-            else:
-                observed_file.state = FileState.AWAITING_MAP_ASSIGNMENT
-            observed_file.save()
+                        # Another upload may have finished with the file while we were parsing
+                        if observed_file.state != target_file.state:
+                            raise ValidationError(
+                                "File was changed by another upload while this one was processed"
+                            )
+                    if mapping is not None:
+                        observed_file.mapping = mapping
+                        observed_file.save()
+                        # Delete any existing partitions
+                        observed_file.parquet_partitions.all().delete()
+                        # Save parquet partitions to storage
+                        # Only the top level of the output directory is needed, so don't walk it
+                        with os.scandir(harvester.data_file_name) as entries:
+                            partitions = [e for e in entries if not e.is_dir()]
+                        for i, entry in enumerate(partitions):
+                            if entry.name.endswith(".parquet"):
+                                # The partition's file is written to storage by save(),
+                                # so the handle can be closed straight afterwards
+                                with open(entry.path, "rb") as parquet_file:
+                                    partition = ParquetPartition(
+                                        observed_file=observed_file,
+                                        partition_number=i,
+                                        bytes_required=entry.stat().st_size,
+                                        parquet_file=File(
+                                            file=parquet_file, name=entry.name
+                                        ),
+                                    )
+                                    partitions_written.append(partition)
+                                    partition.save(force_insert=True)
+                        try:
+                            # The preview is only stored when observed_file is saved below,
+                            # so read the (small) image now rather than hold its file open
+                            with open(harvester.png_file_name, "rb") as png_file:
+                                observed_file.png = ContentFile(
+                                    png_file.read(),
+                                    name=os.path.basename(harvester.png_file_name),
+                                )
+                                png_written = True
+                        except (
+                            FileNotFoundError
+                        ):  # don't fail the whole process if the PNG can't be saved
+                            logger.exception("Error saving PNG")
+                            pass
+                        observed_file.state = FileState.IMPORTED
+                    else:
+                        observed_file.state = FileState.AWAITING_MAP_ASSIGNMENT
+                    observed_file.save()
+            except BaseException:
+                written = [p.parquet_file for p in partitions_written]
+                if png_written:
+                    written.append(observed_file.png)
+                for field_file in written:
+                    if field_file and field_file._committed:
+                        field_file.delete(save=False)
+                raise
             return observed_file
         except UnsupportedFileTypeError:
             raise ValidationError("Unsupported file type")
+        except ValidationError:
+            # Expected rejections carry their own message for the client
+            raise
         except Exception as e:
             logger.exception("Error processing file.")
             raise ValidationError("Error processing file.") from e
@@ -2394,7 +2509,7 @@ class ObservedFileCreateSerializer(ObservedFileSerializer, WithTeamMixin):
         ),
     ]
 )
-class HarvestErrorSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
+class HarvestErrorSerializer(HyperlinkedIdModelSerializer, PermissionsMixin):
     harvester = TruncatedHyperlinkedRelatedIdField(
         "HarvesterSerializer",
         ["name", "lab"],
@@ -2437,7 +2552,7 @@ class DataUnitSerializer(serializers.ModelSerializer, WithTeamMixin, Permissions
 
 
 class DataColumnTypeSerializer(
-    serializers.HyperlinkedModelSerializer, WithTeamMixin, PermissionsMixin
+    CachedFieldsMixin, HyperlinkedIdModelSerializer, WithTeamMixin, PermissionsMixin
 ):
     unit = TruncatedHyperlinkedRelatedIdField(
         "DataUnitSerializer",
@@ -2504,7 +2619,10 @@ class DataColumnTypeSerializer(
     ]
 )
 class ExperimentSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin, WithTeamMixin
+    EagerLoadingMixin,
+    HyperlinkedIdModelSerializer,
+    PermissionsMixin,
+    WithTeamMixin,
 ):
     cycler_tests = TruncatedHyperlinkedRelatedIdField(
         "CyclerTestSerializer",
@@ -2569,15 +2687,14 @@ class ExperimentSerializer(
     ]
 )
 class ValidationSchemaSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin, WithTeamMixin
+    HyperlinkedIdModelSerializer, PermissionsMixin, WithTeamMixin
 ):
     def validate_schema(self, value):
+        # Only the schema itself is checked; there is no instance to validate against it
         try:
-            jsonschema.validate({}, value)
+            jsonschema.validators.validator_for(value).check_schema(value)
         except jsonschema.exceptions.SchemaError as e:
             raise ValidationError(e)
-        except jsonschema.exceptions.ValidationError:
-            pass
         return value
 
     class Meta:
@@ -2618,7 +2735,7 @@ class ValidationSchemaSerializer(
         ),
     ]
 )
-class KnoxTokenSerializer(serializers.HyperlinkedModelSerializer, PermissionsMixin):
+class KnoxTokenSerializer(HyperlinkedIdModelSerializer, PermissionsMixin):
     created = serializers.SerializerMethodField(help_text="Date and time of creation")
     expiry = serializers.SerializerMethodField(
         help_text="Date and time token expires (blank = never)"
@@ -2626,11 +2743,22 @@ class KnoxTokenSerializer(serializers.HyperlinkedModelSerializer, PermissionsMix
     url = serializers.SerializerMethodField(help_text=url_help_text)
 
     def knox_token(self, instance):
-        if not instance.user == self.context["request"].user:
+        user_id = self.context["request"].user.id
+        if instance.user_id is None or instance.user_id != user_id:
             raise ValueError("Bad user ID for token access")
-        return AuthToken.objects.get(
-            user=instance.user, token_key=instance.knox_token_key
-        )
+        # created and expiry are read for every token listed,
+        # so load all the user's tokens once per response
+        tokens = self.context.get("_auth_tokens")
+        if tokens is None:
+            tokens = self.context["_auth_tokens"] = {
+                t.token_key: t for t in AuthToken.objects.filter(user_id=user_id)
+            }
+        token = tokens.get(instance.knox_token_key)
+        if token is None:
+            token = AuthToken.objects.get(
+                user_id=user_id, token_key=instance.knox_token_key
+            )
+        return token
 
     def get_created(self, instance) -> timezone.datetime:
         return self.knox_token(instance).created
@@ -2639,9 +2767,7 @@ class KnoxTokenSerializer(serializers.HyperlinkedModelSerializer, PermissionsMix
         return self.knox_token(instance).expiry
 
     def get_url(self, instance) -> str:
-        return reverse(
-            "tokens-detail", args=(instance.id,), request=self.context["request"]
-        )
+        return reverse_object_url("tokens-detail", instance.id, self.context["request"])
 
     class Meta:
         model = KnoxAuthToken
@@ -2730,6 +2856,22 @@ class HarvesterConfigSerializer(HarvesterSerializer, PermissionsMixin):
     def get_max_upload_bytes(self, _):
         return DATA_UPLOAD_MAX_MEMORY_SIZE
 
+    # environment_variables is read by both EnvField and get_deleted_environment_variables
+    prefetch_related_fields = (
+        Prefetch(
+            "environment_variables",
+            queryset=HarvesterEnvVar.objects.only(
+                "harvester", "key", "value", "deleted"
+            ),
+        ),
+        Prefetch(
+            "monitored_paths",
+            queryset=MonitoredPathSerializer.setup_eager_loading(
+                MonitoredPath.objects.all()
+            ),
+        ),
+    )
+
     def get_deleted_environment_variables(self, instance):
         return [v.key for v in instance.environment_variables.all() if v.deleted]
 
@@ -2765,14 +2907,19 @@ class HarvesterCreateSerializer(HarvesterSerializer, PermissionsMixin):
     )
 
     def validate_lab(self, value):
-        try:
-            if value.pk in self.context["request"].user_auth_details.writeable_lab_ids:
-                return value
-        except BaseException:
-            pass
-        raise ValidationError("You may only create Harvesters in your own lab(s)")
+        request = self.context.get("request")
+        if (
+            request is None
+            or value.pk not in get_user_auth_details(request).writeable_lab_ids
+        ):
+            raise ValidationError("You may only create Harvesters in your own lab(s)")
+        return value
 
     def to_representation(self, instance):
+        # Load what the config reads in one go, as the config endpoint does
+        prefetch_related_objects(
+            [instance], *HarvesterConfigSerializer.prefetch_related_fields
+        )
         return HarvesterConfigSerializer(context=self.context).to_representation(
             instance
         )
@@ -2785,8 +2932,11 @@ class HarvesterCreateSerializer(HarvesterSerializer, PermissionsMixin):
 
 
 class SchemaValidationSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin
+    EagerLoadingMixin, HyperlinkedIdModelSerializer, PermissionsMixin
 ):
+    # Only the schema's name and permissions are read, not its JSON documents
+    deferred_fields = ("schema__schema", "schema__custom_properties")
+
     schema = TruncatedHyperlinkedRelatedIdField(
         "ValidationSchemaSerializer",
         ["name"],
@@ -2801,10 +2951,12 @@ class SchemaValidationSerializer(
 
     @extend_schema_field(OpenApiTypes.URI)
     def get_validation_target(self, instance):
-        return reverse(
-            f"{instance.content_type.model}-detail",
-            args=(instance.object_id,),
-            request=self.context["request"],
+        # ContentTypes are cached per process, so this needn't join or query per row
+        content_type = ContentType.objects.get_for_id(instance.content_type_id)
+        return reverse_object_url(
+            f"{content_type.model}-detail",
+            instance.object_id,
+            self.context["request"],
         )
 
     class Meta:
@@ -2824,8 +2976,12 @@ class SchemaValidationSerializer(
 
 
 class ArbitraryFileSerializer(
-    serializers.HyperlinkedModelSerializer, PermissionsMixin, WithTeamMixin
+    EagerLoadingMixin, HyperlinkedIdModelSerializer, PermissionsMixin, WithTeamMixin
 ):
+    # File URLs are built by the storage type, which is looked up via the team's lab
+    select_related_fields = ("team__lab",)
+    prefetch_related_fields = ("storage_type",)
+
     class Meta:
         model = ArbitraryFile
         fields = [
@@ -2858,8 +3014,8 @@ class ArbitraryFileCreateSerializer(ArbitraryFileSerializer):
                     **validated_data, bytes_required=bytes_required
                 )
                 if file:
-                    arbitrary_file.bytes_required = file.size
-                    arbitrary_file.save()
+                    # A full save, because the storage type is only chosen
+                    # while the row above is being inserted
                     arbitrary_file.file.save(file.name, file, save=True)
             except StorageError as e:
                 raise ValidationError(e)
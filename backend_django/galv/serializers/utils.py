@@ -1,8 +1,20 @@
+import copy
+import functools
 import json
+import re
 from collections import OrderedDict
 
+import django.core.exceptions
 import django.db.models
 from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import (
+    NoReverseMatch,
+    get_script_prefix,
+    get_urlconf,
+    reverse as django_reverse,
+)
 from django.utils.module_loading import import_string
 from drf_spectacular.utils import extend_schema_field
 from dry_rest_permissions.generics import DRYPermissionsField
@@ -13,6 +25,7 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from galv.models import GroupProxy, UserProxy, VALIDATION_MOCK_ENDPOINT
 from rest_framework.fields import DictField
 from rest_framework.relations import ManyRelatedField
+from rest_framework.reverse import preserve_builtin_query_params
 
 url_help_text = "Canonical URL for this object"
 
@@ -95,6 +108,102 @@ class CreateOnlyMixin(serializers.ModelSerializer):
         return extra_kwargs_for_edit
 
 
+class CachedFieldsMixin:
+    # Build a serializer class's fields once and give each instance a deep copy,
+    # instead of re-introspecting the model every time the serializer is instantiated.
+    # Serializers whose fields depend on context should override get_fields_cache_key
+    # to return a value that distinguishes the variants.
+    # (No docstring: drf-spectacular would use it as the component description.)
+
+    def get_fields_cache_key(self):
+        return None
+
+    def get_fields(self):
+        # Look in the class's own __dict__ so subclasses never share a parent's cache
+        cache = type(self).__dict__.get("_fields_cache")
+        if cache is None:
+            cache = {}
+            type(self)._fields_cache = cache
+        key = self.get_fields_cache_key()
+        if key not in cache:
+            cache[key] = super().get_fields()
+        return copy.deepcopy(cache[key])
+
+
+class EagerLoadingMixin:
+    # Load the related objects rendered by TruncatedHyperlinkedRelatedIdFields
+    # alongside the queryset, rather than with one query per object.
+    # Forward foreign keys are select_related, many-valued relations are prefetch_related.
+    # Relations read elsewhere (e.g. by permission checks or method fields) can be
+    # declared in select_related_fields and prefetch_related_fields,
+    # and large columns that are never rendered in deferred_fields.
+    # (No docstring: drf-spectacular would use it as the component description.)
+
+    select_related_fields: tuple[str, ...] = ()
+    prefetch_related_fields: tuple[str | django.db.models.Prefetch, ...] = ()
+    deferred_fields: tuple[str, ...] = ()
+
+    @classmethod
+    def get_eager_loading_lookups(cls) -> tuple[list[str], list[str]]:
+        # Look in the class's own __dict__ so subclasses never share a parent's lookups
+        lookups = cls.__dict__.get("_eager_loading_lookups")
+        if lookups is not None:
+            return lookups
+        opts = cls.Meta.model._meta
+        select, prefetch = [], []
+        for name, field in cls._declared_fields.items():
+            many = isinstance(field, ManyRelatedField)
+            relation = field.child_relation if many else field
+            if not isinstance(relation, TruncatedHyperlinkedRelatedIdField):
+                continue
+            source = field.source or name
+            try:
+                model_field = opts.get_field(source)
+            except django.core.exceptions.FieldDoesNotExist:
+                continue
+            if model_field.many_to_many or model_field.one_to_many:
+                prefetch.append(source)
+            elif model_field.concrete and (
+                model_field.many_to_one or model_field.one_to_one
+            ):
+                select.append(source)
+        cls._eager_loading_lookups = (select, prefetch)
+        return cls._eager_loading_lookups
+
+    @classmethod
+    def get_pk_only_prefetch(cls, lookup: str):
+        # Flat output renders each related object as a URL, so only its pk is needed
+        # (plus, for reverse foreign keys, the column that links it back to its parent).
+        model_field = cls.Meta.model._meta.get_field(lookup)
+        related_opts = model_field.related_model._meta
+        columns = [related_opts.pk.name]
+        if model_field.one_to_many:
+            if not isinstance(model_field, django.db.models.ManyToOneRel):
+                return lookup
+            columns.append(model_field.field.name)
+        return django.db.models.Prefetch(
+            lookup,
+            queryset=model_field.related_model._default_manager.only(*columns),
+        )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, pk_only: bool = False):
+        select, prefetch = cls.get_eager_loading_lookups()
+        if pk_only:
+            prefetch = [cls.get_pk_only_prefetch(lookup) for lookup in prefetch]
+        # Declared lookups are read in full, so they never get the pk-only treatment
+        select = [*select, *cls.select_related_fields]
+        prefetch = [*prefetch, *cls.prefetch_related_fields]
+        # select_related() with no arguments would follow every non-null foreign key
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if cls.deferred_fields:
+            queryset = queryset.defer(*cls.deferred_fields)
+        return queryset
+
+
 def augment_extra_kwargs(extra_kwargs: dict[str, dict] = None):
     def _augment(name: str, content: dict):
         if name == "url":
@@ -124,7 +233,121 @@ def get_model_field(
     return fields[field_name]
 
 
-class GetOrCreateTextSerializer(serializers.HyperlinkedModelSerializer):
+_LOOKUP_PLACEHOLDER = "__lookup__"
+# Lookup values that reverse() would neither quote nor reject against the router's
+# default lookup pattern, so they can be spliced straight into a URL template.
+_is_plain_lookup = re.compile(r"[\w-]+", re.ASCII).fullmatch
+
+
+@functools.lru_cache(maxsize=256)
+def _reverse_template(view_name, lookup_url_kwarg, urlconf, script_prefix):
+    """
+    Reverse a detail view once with a placeholder lookup value,
+    returning the (head, tail) either side of it, or None if that isn't possible.
+    """
+    try:
+        url = django_reverse(
+            view_name,
+            kwargs={lookup_url_kwarg: _LOOKUP_PLACEHOLDER},
+            urlconf=urlconf,
+        )
+    except NoReverseMatch:
+        return None
+    head, found, tail = url.partition(_LOOKUP_PLACEHOLDER)
+    if not found or _LOOKUP_PLACEHOLDER in tail:
+        return None
+    return head, tail
+
+
+@functools.lru_cache(maxsize=4096)
+def _reverse_path_uncommon(
+    view_name, lookup_url_kwarg, lookup_value, urlconf, script_prefix
+):
+    return django_reverse(
+        view_name, kwargs={lookup_url_kwarg: lookup_value}, urlconf=urlconf
+    )
+
+
+def _reverse_path(view_name, lookup_url_kwarg, lookup_value, urlconf, script_prefix):
+    """
+    Memoised reverse() for object URLs.
+    Plain pk values (integers, UUIDs) are substituted into a per-view template,
+    so only the first object of each type pays for the resolver lookup.
+    `urlconf` and `script_prefix` are only part of the cache key:
+    reverse() reads both from thread-local state.
+    """
+    value = str(lookup_value)
+    if _is_plain_lookup(value):
+        template = _reverse_template(
+            view_name, lookup_url_kwarg, urlconf, script_prefix
+        )
+        if template is not None:
+            return value.join(template)
+    return _reverse_path_uncommon(
+        view_name, lookup_url_kwarg, lookup_value, urlconf, script_prefix
+    )
+
+
+@receiver(setting_changed)
+def _clear_reverse_path_cache(setting, **kwargs):
+    if setting == "ROOT_URLCONF":
+        _reverse_template.cache_clear()
+        _reverse_path_uncommon.cache_clear()
+
+
+def _absolute_url(url, request):
+    """
+    Finish a cached path as DRF's reverse() does: absolute, and carrying
+    built-in query parameters such as ?format= so links keep the same renderer.
+    """
+    if request is None:
+        return url
+    return preserve_builtin_query_params(request.build_absolute_uri(url), request)
+
+
+def reverse_object_url(view_name, pk, request=None):
+    """
+    URL of the object with primary key `pk` served by the detail-style route `view_name`,
+    built with the same cached reverse as hyperlinked fields.
+    Absolute if a request is supplied, as with DRF's reverse().
+    """
+    url = _reverse_path(view_name, "pk", pk, get_urlconf(), get_script_prefix())
+    return _absolute_url(url, request)
+
+
+class CachedReverseMixin:
+    # Object URLs only vary by lookup value, so build them from a cached template
+    # instead of re-running the resolver's reverse lookup for every row.
+
+    def get_url(self, obj, view_name, request, format):
+        if format or getattr(request, "versioning_scheme", None) is not None:
+            return super().get_url(obj, view_name, request, format)
+        # Unsaved objects will not yet have a valid URL.
+        if hasattr(obj, "pk") and obj.pk in (None, ""):
+            return None
+        url = _reverse_path(
+            view_name,
+            self.lookup_url_kwarg,
+            getattr(obj, self.lookup_field),
+            get_urlconf(),
+            get_script_prefix(),
+        )
+        return _absolute_url(url, request)
+
+
+class HyperlinkedIdentityIdField(
+    CachedReverseMixin, serializers.HyperlinkedIdentityField
+):
+    pass
+
+
+class HyperlinkedIdModelSerializer(serializers.HyperlinkedModelSerializer):
+    # HyperlinkedModelSerializer whose own `url` field uses the cached reverse.
+    # No docstring: drf-spectacular would use it to describe every subclass.
+    serializer_url_field = HyperlinkedIdentityIdField
+
+
+class GetOrCreateTextSerializer(HyperlinkedIdModelSerializer):
     """
     Expose a full AutoCompleteEntry model.
     """
@@ -209,7 +432,13 @@ class GetOrCreateTextFieldList(serializers.ListField):
         return super().to_representation(data.all())
 
 
-class CustomPropertiesModelSerializer(serializers.HyperlinkedModelSerializer):
+@functools.lru_cache(maxsize=None)
+def _has_custom_properties_field(model) -> bool:
+    # Checked on every serializer instantiation, including once per nested object
+    return any(f.name == "custom_properties" for f in model._meta.fields)
+
+
+class CustomPropertiesModelSerializer(HyperlinkedIdModelSerializer):
     """
     A ModelSerializer that maps unrecognised properties in the input to an 'custom_properties' JSONField,
     and unpacks the 'custom_properties' JSONField into the output.
@@ -223,8 +452,7 @@ class CustomPropertiesModelSerializer(serializers.HyperlinkedModelSerializer):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        model_fields = {f.name for f in self.Meta.model._meta.fields}
-        if "custom_properties" not in model_fields:
+        if not _has_custom_properties_field(self.Meta.model):
             raise ValueError(
                 "CustomPropertiesModelSerializer must define custom_properties"
             )
@@ -271,7 +499,9 @@ class UserProxyField(serializers.Field):
         return target
 
 
-class HyperlinkedRelatedIdField(serializers.HyperlinkedRelatedField):
+class HyperlinkedRelatedIdField(
+    CachedReverseMixin, serializers.HyperlinkedRelatedField
+):
     """
     A HyperlinkedRelatedField that can be written to more flexibly.
     Lookup priority is, in order:
@@ -309,9 +539,6 @@ class HyperlinkedRelatedIdField(serializers.HyperlinkedRelatedField):
         ):
             return super().to_internal_value(data)
 
-    def to_representation(self, value):
-        return super().to_representation(value)
-
 
 class GroupHyperlinkedRelatedIdListField(HyperlinkedRelatedIdField, GroupProxyField):
     pass
@@ -399,12 +626,20 @@ class TruncatedHyperlinkedRelatedIdField(HyperlinkedRelatedIdField):
         return OrderedDict([(item.pk, self.display_value(item)) for item in queryset])
 
     def use_pk_only_optimization(self):
-        return False
+        # Flat output is just the URL, which only needs the pk.
+        # DRF can then read the FK id off the parent without fetching the related object.
+        try:
+            return get_output_style(self.context["request"]) != OUTPUT_STYLE_CONTEXT
+        except (AttributeError, KeyError):
+            return False
 
 
 class TruncatedGroupHyperlinkedRelatedIdField(
     TruncatedHyperlinkedRelatedIdField, GroupProxyField
 ):
+    def use_pk_only_optimization(self):
+        return False
+
     def to_representation(self, instance):
         instance.__class__ = GroupProxy
         return super().to_representation(instance)
@@ -413,6 +648,9 @@ class TruncatedGroupHyperlinkedRelatedIdField(
 class TruncatedUserHyperlinkedRelatedIdField(
     TruncatedHyperlinkedRelatedIdField, UserProxyField
 ):
+    def use_pk_only_optimization(self):
+        return False
+
     def to_representation(self, instance):
         instance.__class__ = UserProxy
         return super().to_representation(instance)
@@ -453,9 +691,6 @@ class PasswordField(serializers.CharField):
         self.show_first_chars = show_first_chars
         self.min_length = min_length
 
-    def to_internal_value(self, data):
-        return super().to_internal_value(data)
-
     def to_representation(self, value):
         v = super().to_representation(value)
         if v is None:
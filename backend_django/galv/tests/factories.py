@@ -167,37 +167,41 @@ class ScheduleIdentifiersFactory(DjangoModelFactory):
     value = factory.Faker("bs")
 
 
-def generate_create_dict(root_factory: factory.django.DjangoModelFactory):
-    def stub_to_entry(stub, **kwargs):
-        try:
-            obj = stub.factory_wrapper.factory._meta.model.objects.get(**kwargs)
-        except (
-            stub.factory_wrapper.factory._meta.model.DoesNotExist,
-            stub.factory_wrapper.factory._meta.model.MultipleObjectsReturned,
+def _stub_to_entry(stub, **kwargs):
+    try:
+        obj = stub.factory_wrapper.factory._meta.model.objects.get(**kwargs)
+    except (
+        stub.factory_wrapper.factory._meta.model.DoesNotExist,
+        stub.factory_wrapper.factory._meta.model.MultipleObjectsReturned,
+    ):
+        obj = stub.factory_wrapper.factory.create(**kwargs)
+    # Check for autocomplete entries
+    if isinstance(obj, AutoCompleteEntry):
+        return obj.value
+    else:
+        return obj.pk
+
+
+def _dict_factory(client_factory, **kwargs):
+    dict = client_factory.stub(**kwargs).__dict__
+    # Create children
+    for key, value in client_factory._meta.declarations.items():
+        if isinstance(value, factory.SubFactory):
+            dict[key] = _stub_to_entry(value, **kwargs.pop(key, {}))
+        elif (
+            isinstance(value, list)
+            and len(value) > 0
+            and isinstance(value[0], factory.SubFactory)
         ):
-            obj = stub.factory_wrapper.factory.create(**kwargs)
-        # Check for autocomplete entries
-        if isinstance(obj, AutoCompleteEntry):
-            return obj.value
-        else:
-            return obj.pk
-
-    def dict_factory(client_factory, **kwargs):
-        dict = client_factory.stub(**kwargs).__dict__
-        # Create children
-        for key, value in client_factory._meta.declarations.items():
-            if isinstance(value, factory.SubFactory):
-                dict[key] = stub_to_entry(value, **kwargs.pop(key, {}))
-            elif (
-                isinstance(value, list)
-                and len(value) > 0
-                and isinstance(value[0], factory.SubFactory)
-            ):
-                child_kwargs = kwargs.pop(key, {})
-                dict[key] = [stub_to_entry(v, **child_kwargs) for v in value]
-        return dict
-
-    return partial(dict_factory, root_factory)
+            child_kwargs = kwargs.pop(key, {})
+            dict[key] = [_stub_to_entry(v, **child_kwargs) for v in value]
+    return dict
+
+
+def generate_create_dict(root_factory: factory.django.DjangoModelFactory):
+    # Module-level functions rather than closures, so that test cases holding the
+    # result can be pickled by the parallel test runner
+    return partial(_dict_factory, root_factory)
 
 
 class UserFactory(DjangoModelFactory):
@@ -5,8 +5,14 @@
 import unittest
 import logging
 
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from ..serializers import CellFamilySerializer
+
 from .utils import GalvTeamResourceTestCase
-from .factories import CellFamilyFactory
+from .factories import CellFamilyFactory, UserFactory
 
 logger = logging.getLogger(__file__)
 logger.setLevel(logging.INFO)
@@ -17,6 +23,40 @@ class CellFamilyTests(GalvTeamResourceTestCase):
     factory = CellFamilyFactory
     edit_kwargs = {"form_factor": "test"}
 
+    def without_team(self):
+        create_dict = self.dict_factory(
+            team={"name": self.lab_team.name, "lab": self.lab_team.lab}
+        )
+        create_dict["team"] = None
+        return create_dict
+
+    def test_create_defaults_to_only_team(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(
+            reverse(f"{self.stub}-list"), self.without_team(), format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(response.json()["team"].endswith(f"/teams/{self.lab_team.id}/"))
+
+    def test_create_without_team_rejected(self):
+        no_team_user = UserFactory.create(username="cellfamily_no_team_user")
+        self.lab_other_team.member_group.user_set.add(self.admin)
+        for user, description in [
+            (no_team_user, "no teams"),
+            (self.admin, "multiple teams"),
+        ]:
+            with self.subTest(user=description):
+                request = APIRequestFactory().post(reverse(f"{self.stub}-list"))
+                request.user = user
+                serializer = CellFamilySerializer(
+                    data=self.without_team(), context={"request": request}
+                )
+                self.assertFalse(serializer.is_valid())
+                self.assertEqual(
+                    serializer.errors["team"],
+                    ["You may only create resources in your own team(s)"],
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
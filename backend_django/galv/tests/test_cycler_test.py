@@ -5,6 +5,9 @@
 import unittest
 import logging
 
+from django.urls import reverse
+from rest_framework import status
+
 from .utils import GalvTeamResourceTestCase
 from .factories import CyclerTestFactory, CellFactory
 
@@ -20,6 +23,43 @@ class CyclerTestTests(GalvTeamResourceTestCase):
         cell = CellFactory.create()
         return {"cell": cell.pk}
 
+    def create_rendered_cycler_test(self):
+        cycler_test = CyclerTestFactory.create(team=self.lab_team)
+        cycler_test.schedule.family.pybamm_template = ["Charge at {rate} C"]
+        cycler_test.schedule.family.save()
+        cycler_test.schedule.pybamm_schedule_variables = {"rate": 1}
+        cycler_test.schedule.save()
+        return cycler_test
+
+    def get_listed(self, cycler_test, **params):
+        response = self.client.get(reverse(f"{self.stub}-list"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return next(
+            r for r in response.json()["results"] if r["id"] == str(cycler_test.id)
+        )
+
+    def test_list_rendered_schedule(self):
+        cycler_test = self.create_rendered_cycler_test()
+        self.client.force_authenticate(self.user)
+        with self.subTest("Not rendered by default"):
+            self.assertIsNone(self.get_listed(cycler_test)["rendered_schedule"])
+        with self.subTest("Rendered when included"):
+            self.assertEqual(
+                self.get_listed(cycler_test, include="rendered_schedule")[
+                    "rendered_schedule"
+                ],
+                ["Charge at 1 C"],
+            )
+
+    def test_detail_rendered_schedule(self):
+        cycler_test = self.create_rendered_cycler_test()
+        self.client.force_authenticate(self.user)
+        response = self.client.get(
+            reverse(f"{self.stub}-detail", args=(cycler_test.id,))
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["rendered_schedule"], ["Charge at 1 C"])
+
 
 if __name__ == "__main__":
     unittest.main()
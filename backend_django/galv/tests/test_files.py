@@ -3,6 +3,8 @@
 # of Oxford, and the 'Galv' Developers. All rights reserved.
 import tempfile
 import unittest
+from unittest.mock import patch
+
 from django.urls import reverse
 from rest_framework import status
 import logging
@@ -390,6 +392,109 @@ class ObservedFileTests(GalvTestCase):
                         ).exists()
                     )
 
+    def upload_csv(self, **data):
+        """POST the test CSV as a manual upload by self.user."""
+        with tempfile.TemporaryFile() as f:
+            f.write(
+                b"ElapsedTime_s,Current_A,Voltage_V\n1,2,3\n2,2,3\n3,2,3\n4,2,3\n5,2,3\n6,2,3\n7,2,3\n8,2,3\n9,2,3\n10,2,3\n11,3,3\n"
+            )
+            f.seek(0)
+            self.client.force_authenticate(self.user)
+            return self.client.post(
+                reverse(f"{self.stub}-list"),
+                {
+                    "path": "/custom/file/path.csv",
+                    "name": "My CSV File",
+                    "uploader": str(self.user.id),
+                    "team": str(self.lab_team.id),
+                    "file": f,
+                    **data,
+                },
+                format="multipart",
+            )
+
+    def test_reupload_locked(self):
+        """
+        A re-upload must not overwrite a file that another upload changed while it was being parsed,
+        and must not leave partition files in storage when it fails.
+        """
+        from galv_harvester.harvest import InternalHarvestProcessor
+
+        mapping = ColumnMappingFactory.create(map={})
+        response = self.upload_csv()
+        assert_response_property(
+            self, response, self.assertEqual, response.status_code, 201
+        )
+        observed_file = ObservedFile.objects.get(pk=response.json()["id"])
+        process_data = InternalHarvestProcessor.process_data
+
+        with self.subTest("State changed during processing"):
+
+            def process_data_concurrently(harvester):
+                process_data(harvester)
+                ObservedFile.objects.filter(pk=observed_file.pk).update(
+                    state=FileState.IMPORTED
+                )
+
+            # An expected rejection, so it shouldn't be logged as an error
+            with (
+                patch.object(
+                    InternalHarvestProcessor,
+                    "process_data",
+                    autospec=True,
+                    side_effect=process_data_concurrently,
+                ),
+                self.assertNoLogs("galv.serializers.serializers", level="ERROR"),
+            ):
+                response = self.upload_csv(
+                    target_file_id=str(observed_file.id), mapping=str(mapping.id)
+                )
+            assert_response_property(
+                self, response, self.assertEqual, response.status_code, 400
+            )
+            self.assertIn(
+                "File was changed by another upload while this one was processed",
+                str(response.json()),
+            )
+            observed_file.refresh_from_db()
+            self.assertEqual(observed_file.state, FileState.IMPORTED)
+            self.assertFalse(observed_file.parquet_partitions.exists())
+
+        with self.subTest("Stored files removed on failure"):
+            ObservedFile.objects.filter(pk=observed_file.pk).update(
+                state=FileState.AWAITING_MAP_ASSIGNMENT
+            )
+            saved = []
+            partition_save = ParquetPartition.save
+
+            def record_save(partition, *args, **kwargs):
+                partition_save(partition, *args, **kwargs)
+                saved.append(
+                    (partition.parquet_file.storage, partition.parquet_file.name)
+                )
+
+            with (
+                patch.object(
+                    ParquetPartition, "save", autospec=True, side_effect=record_save
+                ),
+                patch(
+                    "galv.serializers.serializers.ContentFile",
+                    side_effect=RuntimeError("Storage unavailable"),
+                ),
+            ):
+                response = self.upload_csv(
+                    target_file_id=str(observed_file.id), mapping=str(mapping.id)
+                )
+            assert_response_property(
+                self, response, self.assertEqual, response.status_code, 400
+            )
+            self.assertTrue(saved)
+            for storage, name in saved:
+                self.assertFalse(storage.exists(name), name)
+            observed_file.refresh_from_db()
+            self.assertEqual(observed_file.state, FileState.AWAITING_MAP_ASSIGNMENT)
+            self.assertFalse(observed_file.parquet_partitions.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
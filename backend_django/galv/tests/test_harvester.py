@@ -2,11 +2,10 @@
 # Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
 # of Oxford, and the 'Galv' Developers. All rights reserved.
 import json
-import tempfile
 import unittest
 from unittest.mock import patch
 
-from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
 from django.urls import reverse
 from rest_framework import status
 import logging
@@ -16,11 +15,11 @@ from .utils import assert_response_property, GalvTestCase
 from .factories import (
     HarvesterFactory,
     MonitoredPathFactory,
-    ParquetPartitionFactory,
+    GalvStorageTypeFactory,
     fake,
     ObservedFileFactory,
 )
-from ..models import HarvestError, ObservedFile, FileState
+from ..models import HarvestError, ObservedFile, FileState, ParquetPartition
 
 logger = logging.getLogger(__file__)
 logger.setLevel(logging.INFO)
@@ -43,26 +42,36 @@ class HarvesterTests(GalvTestCase):
                 s = "anonymous"
         return {"name": f"Harvester_edited_by_{s}"}
 
-    def setUp(self):
-        super().setUp()
-        self.harvester = HarvesterFactory.create(name="Test Harvester", lab=self.lab)
-        self.other_harvester = HarvesterFactory.create(
-            name="Other Harvester", lab=self.lab
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.harvester = HarvesterFactory.create(name="Test Harvester", lab=cls.lab)
+        cls.other_harvester = HarvesterFactory.create(
+            name="Other Harvester", lab=cls.lab
         )
+        cls.list_url = reverse(f"{cls.stub}-list")
+        cls.detail_url = reverse(f"{cls.stub}-detail", args=(cls.harvester.id,))
+        cls.config_url = reverse(f"{cls.stub}-config", args=(cls.harvester.id,))
+        cls.report_url = reverse(f"{cls.stub}-report", args=(cls.harvester.id,))
+        # Shared by the report tests, each of which reports on its own file within it
+        cls.monitored_path = MonitoredPathFactory.create(harvester=cls.harvester)
 
     def test_create_unauthorised(self):
-        for user, login in {
-            "user": lambda: self.client.force_authenticate(self.user),
-            "admin": lambda: self.client.force_authenticate(self.admin),
-            "anonymous": lambda: self.client.logout(),
+        # Rejected requests should stay cheap, so pin each one's query count
+        for user, (login, queries) in {
+            "user": (lambda: self.client.force_authenticate(self.user), 1),
+            "admin": (lambda: self.client.force_authenticate(self.admin), 1),
+            "anonymous": (lambda: self.client.logout(), 0),
         }.items():
             with self.subTest(user=user):
                 login()
-                url = reverse(f"{self.stub}-list")
                 create_dict = self.dict_factory(
                     lab={"id": self.lab.id}, name=f"create_unauth_Harvester {user}"
                 )
-                response = self.client.post(url, create_dict, format="json")
+                with self.assertNumQueries(queries):
+                    response = self.client.post(
+                        self.list_url, create_dict, format="json"
+                    )
                 assert_response_property(
                     self,
                     response,
@@ -74,11 +83,10 @@ class HarvesterTests(GalvTestCase):
 
     def test_cannot_create_in_other_lab(self):
         self.client.force_authenticate(self.lab_admin)
-        url = reverse(f"{self.stub}-list")
         create_dict = self.dict_factory(
             lab={"id": self.strange_lab.id}, name="create_badlab_Harvester"
         )
-        response = self.client.post(url, create_dict, format="json")
+        response = self.client.post(self.list_url, create_dict, format="json")
         assert_response_property(
             self,
             response,
@@ -90,11 +98,10 @@ class HarvesterTests(GalvTestCase):
 
     def test_create_lab_admin(self):
         self.client.force_authenticate(self.lab_admin)
-        url = reverse(f"{self.stub}-list")
         create_dict = self.dict_factory(
             lab={"id": self.lab.id}, name="create_Harvester"
         )
-        response = self.client.post(url, create_dict, format="json")
+        response = self.client.post(self.list_url, create_dict, format="json")
         assert_response_property(
             self,
             response,
@@ -113,8 +120,8 @@ class HarvesterTests(GalvTestCase):
         }.items():
             with self.subTest(user=user):
                 login()
-                url = reverse(f"{self.stub}-config", args=(self.harvester.id,))
-                response = self.client.get(url)
+                with self.assertNumQueries(3):
+                    response = self.client.get(self.config_url)
                 assert_response_property(
                     self,
                     response,
@@ -125,10 +132,10 @@ class HarvesterTests(GalvTestCase):
                 )
 
     def test_harvester_read_config_rejection(self):
-        for token in ["bad_token", self.other_harvester.api_key]:
-            self.client._credentials = {"HTTP_AUTHORIZATION": f"Harvester {token}"}
-            url = reverse(f"{self.stub}-config", args=(self.harvester.id,))
-            response = self.client.get(url)
+        for token, queries in [("bad_token", 1), (self.other_harvester.api_key, 4)]:
+            self.client.credentials(HTTP_AUTHORIZATION=f"Harvester {token}")
+            with self.assertNumQueries(queries):
+                response = self.client.get(self.config_url)
             assert_response_property(
                 self,
                 response,
@@ -139,11 +146,10 @@ class HarvesterTests(GalvTestCase):
             )
 
     def test_harvester_read_config(self):
-        self.client._credentials = {
-            "HTTP_AUTHORIZATION": f"Harvester {self.harvester.api_key}"
-        }
-        url = reverse(f"{self.stub}-config", args=(self.harvester.id,))
-        response = self.client.get(url)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Harvester {self.harvester.api_key}"
+        )
+        response = self.client.get(self.config_url)
         assert_response_property(
             self,
             response,
@@ -175,8 +181,7 @@ class HarvesterTests(GalvTestCase):
         }.items():
             with self.subTest(user=user):
                 details["login"]()
-                url = reverse(f"{self.stub}-list")
-                response = self.client.get(url)
+                response = self.client.get(self.list_url)
                 assert_response_property(
                     self,
                     response,
@@ -196,14 +201,13 @@ class HarvesterTests(GalvTestCase):
                 self.strange_lab_admin
             ),
             "anonymous": lambda: self.client.logout(),
-            "other_harvester": lambda: self.client._credentials.update(
-                {"HTTP_AUTHORIZATION": f"Harvester {self.other_harvester.api_key}"}
+            "other_harvester": lambda: self.client.credentials(
+                HTTP_AUTHORIZATION=f"Harvester {self.other_harvester.api_key}"
             ),
         }.items():
             with self.subTest(user=user):
                 login()
-                url = reverse(f"{self.stub}-detail", args=(self.harvester.id,))
-                response = self.client.get(url)
+                response = self.client.get(self.detail_url)
                 assert_response_property(
                     self,
                     response,
@@ -218,14 +222,13 @@ class HarvesterTests(GalvTestCase):
             "user": lambda: self.client.force_authenticate(self.user),
             "admin": lambda: self.client.force_authenticate(self.admin),
             "lab_admin": lambda: self.client.force_authenticate(self.lab_admin),
-            "harvester": lambda: self.client._credentials.update(
-                {"HTTP_AUTHORIZATION": f"Harvester {self.harvester.api_key}"}
+            "harvester": lambda: self.client.credentials(
+                HTTP_AUTHORIZATION=f"Harvester {self.harvester.api_key}"
             ),
         }.items():
             with self.subTest(user=user):
                 login()
-                url = reverse(f"{self.stub}-detail", args=(self.harvester.id,))
-                response = self.client.get(url)
+                response = self.client.get(self.detail_url)
                 assert_response_property(
                     self,
                     response,
@@ -240,21 +243,27 @@ class HarvesterTests(GalvTestCase):
                 )
 
     def test_update_rejected(self):
-        for user, login in {
-            "user": lambda: self.client.force_authenticate(self.user),
-            "admin": lambda: self.client.force_authenticate(self.admin),
-            "strange_lab_admin": lambda: self.client.force_authenticate(
-                self.strange_lab_admin
+        for user, (login, queries) in {
+            "user": (lambda: self.client.force_authenticate(self.user), 2),
+            "admin": (lambda: self.client.force_authenticate(self.admin), 2),
+            "strange_lab_admin": (
+                lambda: self.client.force_authenticate(self.strange_lab_admin),
+                2,
             ),
-            "anonymous": lambda: self.client.logout(),
-            "other_harvester": lambda: self.client._credentials.update(
-                {"HTTP_AUTHORIZATION": f"Harvester {self.other_harvester.api_key}"}
+            "anonymous": (lambda: self.client.logout(), 1),
+            "other_harvester": (
+                lambda: self.client.credentials(
+                    HTTP_AUTHORIZATION=f"Harvester {self.other_harvester.api_key}"
+                ),
+                3,
             ),
         }.items():
             with self.subTest(user=user):
                 login()
-                url = reverse(f"{self.stub}-detail", args=(self.harvester.id,))
-                response = self.client.patch(url, self.get_edit_kwargs(), format="json")
+                with self.assertNumQueries(queries):
+                    response = self.client.patch(
+                        self.detail_url, self.get_edit_kwargs(), format="json"
+                    )
                 assert_response_property(
                     self,
                     response,
@@ -267,14 +276,16 @@ class HarvesterTests(GalvTestCase):
     def test_update(self):
         for user, login in {
             "lab_admin": lambda: self.client.force_authenticate(self.lab_admin),
-            "harvester": lambda: self.client._credentials.update(
-                {"HTTP_AUTHORIZATION": f"Harvester {self.harvester.api_key}"}
+            "harvester": lambda: self.client.credentials(
+                HTTP_AUTHORIZATION=f"Harvester {self.harvester.api_key}"
             ),
         }.items():
             with self.subTest(user=user):
                 login()
-                url = reverse(f"{self.stub}-detail", args=(self.harvester.id,))
-                response = self.client.patch(url, self.get_edit_kwargs(), format="json")
+                edit_kwargs = self.get_edit_kwargs()
+                response = self.client.patch(
+                    self.detail_url, edit_kwargs, format="json"
+                )
                 assert_response_property(
                     self,
                     response,
@@ -283,14 +294,11 @@ class HarvesterTests(GalvTestCase):
                     200,
                     msg=f"Check {user} can update {self.harvester}",
                 )
-                self.assertEqual(
-                    response.json()["name"], self.get_edit_kwargs()["name"]
-                )
+                self.assertEqual(response.json()["name"], edit_kwargs["name"])
 
     def test_destroy_rejected(self):
         self.client.force_authenticate(self.lab_admin)
-        url = reverse(f"{self.stub}-detail", args=(self.harvester.id,))
-        response = self.client.delete(url)
+        response = self.client.delete(self.detail_url)
         assert_response_property(
             self,
             response,
@@ -302,8 +310,10 @@ class HarvesterTests(GalvTestCase):
 
     def test_report_unauthorized(self):
         self.client.force_authenticate(self.lab_admin)
-        url = reverse(f"{self.stub}-report", args=(self.harvester.id,))
-        response = self.client.post(url, {"status": settings.HARVESTER_STATUS_SUCCESS})
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.report_url, {"status": settings.HARVESTER_STATUS_SUCCESS}
+            )
         assert_response_property(
             self,
             response,
@@ -318,14 +328,20 @@ class HarvesterTests(GalvTestCase):
             return {"url": f"https://example.com/s3/{bucket}/{object}", "fields": {}}
 
     def test_report(self, *args):
-        mp = MonitoredPathFactory.create(harvester=self.harvester)
         f = ObservedFileFactory.create(path="/a/b/c/d.ext", harvester=self.harvester)
-        for i in range(3):
-            ParquetPartitionFactory.create(observed_file=f, partition_number=i)
-        self.client._credentials = {
-            "HTTP_AUTHORIZATION": f"Harvester {self.harvester.api_key}"
-        }
-        url = reverse(f"{self.stub}-report", args=(self.harvester.id,))
+        storage_type = GalvStorageTypeFactory.create(lab=self.harvester.lab)
+        ParquetPartition.objects.bulk_create(
+            [
+                ParquetPartition(
+                    observed_file=f, partition_number=i, storage_type=storage_type
+                )
+                for i in range(3)
+            ]
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Harvester {self.harvester.api_key}"
+        )
+        url = self.report_url
 
         def check_response(response, *args, **kwargs):
             assertion = kwargs.pop("assertion", self.assertEqual)
@@ -338,6 +354,7 @@ class HarvesterTests(GalvTestCase):
         for report in [
             {
                 "name": "no_status",
+                "queries": 3,
                 "data": {},
                 "checks": [
                     lambda r: check_response(
@@ -347,6 +364,7 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "error_none",
+                "queries": 3,
                 "data": {
                     "status": settings.HARVESTER_STATUS_ERROR,
                     "path": "/a/b/c.ext",
@@ -359,6 +377,7 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "error_str",
+                "queries": 16,
                 "data": {
                     "status": settings.HARVESTER_STATUS_ERROR,
                     "path": "/a/b/c.ext",
@@ -373,6 +392,7 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "error_str",
+                "queries": 5,
                 "data": {
                     "status": settings.HARVESTER_STATUS_ERROR,
                     "path": "/a/b/c.ext",
@@ -391,6 +411,7 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "no_path",
+                "queries": 3,
                 "data": {"status": settings.HARVESTER_STATUS_SUCCESS},
                 "checks": [
                     lambda r: check_response(
@@ -400,6 +421,7 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "no_monitored_path",
+                "queries": 3,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": "/a/b/c.ext",
@@ -412,10 +434,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "file_size_no_size",
+                "queries": 4,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": "/a/b/c.ext",
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {"task": settings.HARVESTER_TASK_FILE_SIZE},
                 },
                 "checks": [
@@ -426,10 +449,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "file_size",
+                "queries": 17,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": "/a/b/c.ext",
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {
                         "task": settings.HARVESTER_TASK_FILE_SIZE,
                         "size": 1024,
@@ -449,10 +473,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "import_unrecognised",
+                "queries": 5,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": "/a/b/c.ext",
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {"task": settings.HARVESTER_TASK_IMPORT},
                 },
                 "checks": [
@@ -463,10 +488,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "import_nonexistent_file",
+                "queries": 5,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": "foo/bar.ext",
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {"task": settings.HARVESTER_TASK_IMPORT},
                 },
                 "checks": [
@@ -477,10 +503,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "import_unknown_status",
+                "queries": 5,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": f.path,
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {
                         "task": settings.HARVESTER_TASK_IMPORT,
                         "stage": "unknown",
@@ -494,10 +521,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "import_begin",
+                "queries": 19,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": f.path,
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {
                         "task": settings.HARVESTER_TASK_IMPORT,
                         "stage": settings.HARVEST_STAGE_FILE_METADATA,
@@ -511,9 +539,7 @@ class HarvesterTests(GalvTestCase):
                 },
                 "checks": [
                     lambda r: check_response(r, r.status_code, status.HTTP_200_OK),
-                    lambda r: check_response(
-                        r, r.json()["id"], str(ObservedFile.objects.get(path=f.path).id)
-                    ),
+                    lambda r: check_response(r, r.json()["id"], str(f.id)),
                     lambda r: check_response(
                         r, ObservedFile.objects.get(id=f.id).state, FileState.IMPORTING
                     ),
@@ -521,10 +547,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "import_complete",
+                "queries": 19,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": f.path,
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {
                         "task": settings.HARVESTER_TASK_IMPORT,
                         "stage": settings.HARVEST_STAGE_COMPLETE,
@@ -532,9 +559,7 @@ class HarvesterTests(GalvTestCase):
                 },
                 "checks": [
                     lambda r: check_response(r, r.status_code, status.HTTP_200_OK),
-                    lambda r: check_response(
-                        r, r.json()["id"], str(ObservedFile.objects.get(path=f.path).id)
-                    ),
+                    lambda r: check_response(r, r.json()["id"], str(f.id)),
                     lambda r: check_response(
                         r, ObservedFile.objects.get(id=f.id).state, FileState.IMPORTED
                     ),
@@ -542,10 +567,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "import_failed",
+                "queries": 19,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": f.path,
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {
                         "task": settings.HARVESTER_TASK_IMPORT,
                         "stage": settings.HARVEST_STAGE_FAILED,
@@ -553,9 +579,7 @@ class HarvesterTests(GalvTestCase):
                 },
                 "checks": [
                     lambda r: check_response(r, r.status_code, status.HTTP_200_OK),
-                    lambda r: check_response(
-                        r, r.json()["id"], str(ObservedFile.objects.get(path=f.path).id)
-                    ),
+                    lambda r: check_response(r, r.json()["id"], str(f.id)),
                     lambda r: check_response(
                         r,
                         ObservedFile.objects.get(id=f.id).state,
@@ -565,10 +589,11 @@ class HarvesterTests(GalvTestCase):
             },
             {
                 "name": "import_in_progress",
+                "queries": 22,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": f.path,
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {
                         "task": settings.HARVESTER_TASK_IMPORT,
                         "stage": settings.HARVEST_STAGE_DATA_SUMMARY,
@@ -579,17 +604,16 @@ class HarvesterTests(GalvTestCase):
                 },
                 "checks": [
                     lambda r: check_response(r, r.status_code, status.HTTP_200_OK),
-                    lambda r: check_response(
-                        r, r.json()["id"], str(ObservedFile.objects.get(path=f.path).id)
-                    ),
+                    lambda r: check_response(r, r.json()["id"], str(f.id)),
                 ],
             },
             {
                 "name": "upload_complete",
+                "queries": 26,
                 "data": {
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": f.path,
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "content": {
                         "task": settings.HARVESTER_TASK_IMPORT,
                         "stage": settings.HARVEST_STAGE_UPLOAD_COMPLETE,
@@ -601,14 +625,14 @@ class HarvesterTests(GalvTestCase):
                 },
                 "checks": [
                     lambda r: check_response(r, r.status_code, status.HTTP_200_OK),
-                    lambda r: check_response(
-                        r, r.json()["id"], str(ObservedFile.objects.get(path=f.path).id)
-                    ),
+                    lambda r: check_response(r, r.json()["id"], str(f.id)),
                 ],
             },
         ]:
             with self.subTest(report=report["name"]):
-                response = self.client.post(url, report["data"], format="json")
+                # Reports arrive on every harvester cycle, so pin their cost
+                with self.assertNumQueries(report["queries"]):
+                    response = self.client.post(url, report["data"], format="json")
                 for check in report["checks"]:
                     check(response)
 
@@ -618,35 +642,30 @@ class HarvesterTests(GalvTestCase):
         Test that the parquet upload works.
         We upload a file, along with some data, and check that we receive a ParquetPartition object in response.
         """
-        mp = MonitoredPathFactory.create(harvester=self.harvester)
         f = ObservedFileFactory.create(path="/a/b/c/d/e.ext", harvester=self.harvester)
-        self.client._credentials = {
-            "HTTP_AUTHORIZATION": f"Harvester {self.harvester.api_key}"
-        }
-        url = reverse(f"{self.stub}-report", args=(self.harvester.id,))
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Harvester {self.harvester.api_key}"
+        )
+        url = self.report_url
         response = self.client.post(
             url,
             {
                 "format": "flat",
                 "status": settings.HARVESTER_STATUS_SUCCESS,
                 "path": f.path,
-                "monitored_path_id": mp.id,
+                "monitored_path_id": self.monitored_path.id,
                 "task": settings.HARVESTER_TASK_IMPORT,
                 "stage": settings.HARVEST_STAGE_UPLOAD_PARQUET,
                 "total_row_count": 500,
                 "partition_number": 0,
                 "partition_count": 1,
                 "filename": "filename.part0.parquet",
-                "parquet_file": tempfile.TemporaryFile(),
+                "parquet_file": SimpleUploadedFile("filename.part0.parquet", b""),
             },
             format="multipart",
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(
-            response.json()["observed_file"].endswith(
-                f"{ObservedFile.objects.get(path=f.path).id}/"
-            )
-        )
+        self.assertTrue(response.json()["observed_file"].endswith(f"{f.id}/"))
 
         # We should get an error if storage is full
         with self.subTest("Cannot save when storage is over quota"):
@@ -659,7 +678,7 @@ class HarvesterTests(GalvTestCase):
                     "format": "flat",
                     "status": settings.HARVESTER_STATUS_SUCCESS,
                     "path": f.path,
-                    "monitored_path_id": mp.id,
+                    "monitored_path_id": self.monitored_path.id,
                     "task": settings.HARVESTER_TASK_IMPORT,
                     "stage": settings.HARVEST_STAGE_UPLOAD_PARQUET,
                     "total_row_count": 500,
@@ -678,25 +697,23 @@ class HarvesterTests(GalvTestCase):
             self.assertEqual(response.status_code, status.HTTP_507_INSUFFICIENT_STORAGE)
 
     def test_png_upload(self):
-        mp = MonitoredPathFactory.create(harvester=self.harvester)
         f = ObservedFileFactory.create(
             path="/a/b/c/d/e/f.ext", harvester=self.harvester
         )
-        self.client._credentials = {
-            "HTTP_AUTHORIZATION": f"Harvester {self.harvester.api_key}"
-        }
-        url = reverse(f"{self.stub}-report", args=(self.harvester.id,))
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Harvester {self.harvester.api_key}"
+        )
         response = self.client.post(
-            url,
+            self.report_url,
             {
                 "format": "flat",
                 "status": settings.HARVESTER_STATUS_SUCCESS,
                 "path": f.path,
-                "monitored_path_id": mp.id,
+                "monitored_path_id": self.monitored_path.id,
                 "task": settings.HARVESTER_TASK_IMPORT,
                 "stage": settings.HARVEST_STAGE_UPLOAD_PNG,
                 "filename": "test.png",
-                "png_file": tempfile.TemporaryFile(),
+                "png_file": SimpleUploadedFile("test.png", b""),
             },
             format="multipart",
         )
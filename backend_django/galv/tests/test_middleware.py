@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
+# of Oxford, and the 'Galv' Developers. All rights reserved.
+
+from django.conf import settings
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from ..models import HarvestError, Harvester
+from .factories import HarvesterFactory, LabFactory, UserFactory
+
+
+class AppendSlashMiddlewareTests(APITestCase):
+    """
+    Slash-less URLs are served from their slashed route, without a redirect.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lab = LabFactory.create(name="Slash Lab")
+        cls.lab_admin = UserFactory.create(username="slash_lab_admin")
+        cls.lab.admin_group.user_set.add(cls.lab_admin)
+        cls.harvester = HarvesterFactory.create(name="Slash Harvester", lab=cls.lab)
+        cls.other_harvester = HarvesterFactory.create(
+            name="Other Slash Harvester", lab=cls.lab
+        )
+
+    def test_get(self):
+        self.client.force_authenticate(self.lab_admin)
+        response = self.client.get("/harvesters")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), self.client.get("/harvesters/").json())
+
+    def test_post(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Harvester {self.harvester.api_key}"
+        )
+        response = self.client.post(
+            f"/harvesters/{self.harvester.id}/report",
+            {
+                "status": settings.HARVESTER_STATUS_ERROR,
+                "path": "/a/b/c.ext",
+                "error": "slashless",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(HarvestError.objects.filter(error="slashless").exists())
+
+    def test_patch(self):
+        self.client.force_authenticate(self.lab_admin)
+        response = self.client.patch(
+            f"/harvesters/{self.harvester.id}", {"name": "Renamed"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Harvester.objects.get(pk=self.harvester.pk).name, "Renamed")
+
+    def test_unknown_path(self):
+        self.client.force_authenticate(self.lab_admin)
+        for path in ["/no_such_endpoint", "/harvesters/not-a-harvester/nothing"]:
+            with self.subTest(path=path):
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(APPEND_SLASH=False)
+    def test_append_slash_disabled(self):
+        self.client.force_authenticate(self.lab_admin)
+        response = self.client.get("/harvesters")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get("/harvesters/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_query_string(self):
+        self.client.force_authenticate(self.lab_admin)
+        response = self.client.get("/harvesters?limit=1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body["count"], 2)
+        self.assertEqual(len(body["results"]), 1)
+        self.assertIn("limit=1", body["next"])
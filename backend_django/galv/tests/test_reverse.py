@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
+# of Oxford, and the 'Galv' Developers. All rights reserved.
+
+import uuid
+
+from django.core.handlers.wsgi import get_script_name
+from django.test import SimpleTestCase, override_settings
+from django.urls import include, path, reverse, set_script_prefix
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from ..models import Lab
+from ..serializers.utils import HyperlinkedIdentityIdField, reverse_object_url
+from .factories import (
+    HarvesterFactory,
+    LabFactory,
+    ObservedFileFactory,
+    TeamFactory,
+    UserFactory,
+)
+
+# Used as ROOT_URLCONF to serve the API under a path prefix
+urlpatterns = [path("api/", include("config.urls"))]
+
+
+class CachedReverseTests(SimpleTestCase):
+    """
+    The cached object-URL reverse must agree with reverse()
+    whichever URLconf and script prefix are in force.
+    """
+
+    def setUp(self):
+        self.pk = uuid.uuid4()
+        self.field = HyperlinkedIdentityIdField(view_name="lab-detail")
+
+    def get_urls(self):
+        return (
+            reverse_object_url("lab-detail", self.pk),
+            self.field.get_url(Lab(pk=self.pk), "lab-detail", None, None),
+        )
+
+    def assertUrls(self, expected):
+        self.assertEqual(reverse("lab-detail", args=(self.pk,)), expected)
+        for url in self.get_urls():
+            self.assertEqual(url, expected)
+
+    def test_default(self):
+        self.assertUrls(f"/labs/{self.pk}/")
+
+    def test_root_urlconf(self):
+        # Fill the cache under the default URLconf first
+        self.assertUrls(f"/labs/{self.pk}/")
+        with override_settings(ROOT_URLCONF=__name__):
+            self.assertUrls(f"/api/labs/{self.pk}/")
+        self.assertUrls(f"/labs/{self.pk}/")
+
+    def test_force_script_name(self):
+        self.assertUrls(f"/labs/{self.pk}/")
+        with override_settings(FORCE_SCRIPT_NAME="/galv/"):
+            # As the WSGI handler does at the start of each request
+            set_script_prefix(get_script_name({}))
+            try:
+                self.assertUrls(f"/galv/labs/{self.pk}/")
+            finally:
+                set_script_prefix("/")
+        self.assertUrls(f"/labs/{self.pk}/")
+
+
+class FormatOverrideTests(APITestCase):
+    """
+    Cached object URLs carry ?format= through, as DRF's reverse() does,
+    so links can be followed with the same renderer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.lab = LabFactory.create(name="Format Lab")
+        cls.lab_admin = UserFactory.create(username="format_lab_admin")
+        cls.lab.admin_group.user_set.add(cls.lab_admin)
+        cls.harvester = HarvesterFactory.create(name="Format Harvester", lab=cls.lab)
+
+    def setUp(self):
+        self.client.force_authenticate(self.lab_admin)
+
+    def test_related_urls(self):
+        response = self.client.get(reverse("harvester-list"), {"format": "json"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        harvester = response.json()["results"][0]
+        self.assertEqual(
+            harvester["lab"], f"http://testserver/labs/{self.lab.pk}/?format=json"
+        )
+
+    def test_own_url(self):
+        url = f"http://testserver/harvesters/{self.harvester.pk}/?format=json"
+        response = self.client.get(reverse("harvester-list"), {"format": "json"})
+        self.assertEqual(response.json()["results"][0]["url"], url)
+        response = self.client.get(
+            reverse("harvester-detail", args=(self.harvester.pk,)), {"format": "json"}
+        )
+        self.assertEqual(response.json()["url"], url)
+
+    def test_method_field_urls(self):
+        response = self.client.get(
+            reverse("lab-detail", args=(self.lab.pk,)), {"format": "json"}
+        )
+        storages = response.json()["storages"]
+        self.assertTrue(storages)
+        for url in storages:
+            self.assertTrue(url.endswith("/?format=json"), url)
+
+        observed_file = ObservedFileFactory.create(
+            harvester=self.harvester, team=TeamFactory.create(lab=self.lab)
+        )
+        response = self.client.get(
+            reverse("observedfile-detail", args=(observed_file.pk,)),
+            {"format": "json"},
+        )
+        for field in ["summary", "extra_metadata", "applicable_mappings"]:
+            self.assertTrue(
+                response.json()[field].endswith("/?format=json"),
+                response.json()[field],
+            )
+
+    def test_no_override(self):
+        response = self.client.get(reverse("harvester-list"))
+        harvester = response.json()["results"][0]
+        self.assertEqual(harvester["lab"], f"http://testserver/labs/{self.lab.pk}/")
+        self.assertEqual(
+            harvester["url"], f"http://testserver/harvesters/{self.harvester.pk}/"
+        )
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
+# of Oxford, and the 'Galv' Developers. All rights reserved.
+
+from django.test import TestCase
+from django.urls import reverse
+
+from ..views import CachedSpectacularAPIView
+
+
+class SchemaCacheTests(TestCase):
+    """
+    Only the default schema is cached; client-chosen versions and languages
+    are generated on demand so they cannot fill the cache.
+    """
+
+    def setUp(self):
+        CachedSpectacularAPIView._default_schema = None
+        self.url = reverse("schema")
+
+    def get_schema(self, **params):
+        response = self.client.get(
+            self.url, {"format": "json", **params}, HTTP_ACCEPT="*/*"
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_default_schema_is_cached(self):
+        schema = self.get_schema()
+        cached = CachedSpectacularAPIView._default_schema
+        self.assertIsNotNone(cached)
+        self.assertEqual(self.get_schema(), schema)
+        self.assertIs(CachedSpectacularAPIView._default_schema, cached)
+
+    def test_unknown_version_is_not_cached(self):
+        default = self.get_schema()
+        cached = CachedSpectacularAPIView._default_schema
+        for i in range(3):
+            with self.subTest(version=f"junk{i}"):
+                schema = self.get_schema(version=f"junk{i}")
+                self.assertTrue(schema["info"]["version"].endswith(f"(junk{i})"))
+                self.assertIs(CachedSpectacularAPIView._default_schema, cached)
+        self.assertEqual(self.get_schema(), default)
+
+    def test_unknown_language_is_not_cached(self):
+        self.get_schema(lang="xx-yy")
+        self.assertIsNone(CachedSpectacularAPIView._default_schema)
@@ -2,11 +2,24 @@
 # Copyright  (c) 2020-2023, The Chancellor, Masters and Scholars of the University
 # of Oxford, and the 'Galv' Developers. All rights reserved.
 
+import importlib
 import unittest
 import logging
+from unittest.mock import patch
 
+from django.test import TestCase
+
+from ..models import SchemaValidation, ValidationSchema, ValidationStatus
 from .utils import GalvTeamResourceTestCase
-from .factories import ValidationSchemaFactory, to_validation_schema
+from .factories import (
+    CellFamilyFactory,
+    UserFactory,
+    ValidationSchemaFactory,
+    to_validation_schema,
+)
+
+# galv.models re-exports django.db.models as `models`, hiding the submodule
+galv_models = importlib.import_module("galv.models.models")
 
 logger = logging.getLogger(__file__)
 logger.setLevel(logging.INFO)
@@ -18,5 +31,59 @@ class ValidationSchemaTests(GalvTeamResourceTestCase):
     edit_kwargs = {"schema": to_validation_schema({"type": "object"})}
 
 
+class ValidatorCacheTests(TestCase):
+    """
+    Compiled validators are reused, but never outlive their schema's content.
+    """
+
+    def setUp(self):
+        galv_models._validator_cache.clear()
+        # Validation serializes its target as a superuser
+        UserFactory.create(is_superuser=True)
+        self.family = CellFamilyFactory.create()
+        self.schema = ValidationSchemaFactory.create(
+            team=self.family.team, schema=self.make_schema(["not_a_field"])
+        )
+
+    @staticmethod
+    def make_schema(required):
+        return {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$defs": {"CellFamily": {"type": "object", "required": required}},
+        }
+
+    def validate(self):
+        validation = SchemaValidation(
+            schema=ValidationSchema.objects.get(pk=self.schema.pk),
+            validation_target=self.family,
+        )
+        validation.validate(halt_on_error=True)
+        return validation.status
+
+    def test_edit_without_save_is_picked_up(self):
+        self.assertEqual(self.validate(), ValidationStatus.INVALID)
+        # update() bypasses save(), so the schema's modified time is unchanged
+        ValidationSchema.objects.filter(pk=self.schema.pk).update(
+            schema=self.make_schema([])
+        )
+        self.assertEqual(self.validate(), ValidationStatus.VALID)
+
+    def test_delete_evicts(self):
+        self.validate()
+        self.assertIn((self.schema.pk, "CellFamily"), galv_models._validator_cache)
+        ValidationSchema.objects.filter(pk=self.schema.pk).delete()
+        self.assertNotIn((self.schema.pk, "CellFamily"), galv_models._validator_cache)
+
+    @patch.object(galv_models, "_VALIDATOR_CACHE_SIZE", 2)
+    def test_cache_is_bounded(self):
+        schemas = [self.schema, *ValidationSchemaFactory.create_batch(2)]
+        for schema in schemas:
+            galv_models._get_validator(schema, "CellFamily")
+        self.assertEqual(
+            list(galv_models._validator_cache),
+            [(s.pk, "CellFamily") for s in schemas[1:]],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -44,7 +44,6 @@ class GalvTestCase(APITestCaseWrapper):
             "abstract", False
         )
         super().__init__(*args, **kwargs)
-        self.create_resource_users_run = False
         if abstract:
             return
         if (
@@ -81,51 +80,56 @@ class GalvTestCase(APITestCaseWrapper):
         new_resource.delete()
         return new_resource_dict
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Abstract base classes have no stub and no tests to share the users with
+        if cls.stub is not None:
+            cls.create_resource_users()
+
     def setUp(self) -> None:
         super().setUp()
         if self.__class__.__name__ == "GalvTestCase":
             raise self.skipTest("This is an abstract base class")
-        self.create_resource_users()
 
-    def create_resource_users(self) -> None:
+    @classmethod
+    def create_resource_users(cls) -> None:
         """
         Create users and resources for testing access to resources.
-        Of particular note, this creates a self.user and self.admin
-        who are member/admin in self.lab_team.
-        """
-        if getattr(self, "create_resource_users_run", False):
-            return
-
-        prefix = self.stub
-
-        self.lab = LabFactory.create(name=f"{prefix} Lab")
-        self.lab_team = TeamFactory.create(name=f"{prefix} Lab Team", lab=self.lab)
-        self.user = UserFactory.create(username=f"{prefix}_user")
-        self.lab_team.member_group.user_set.add(self.user)
-        self.admin = UserFactory.create(username=f"{prefix}_admin")
-        self.lab_team.admin_group.user_set.add(self.admin)
-        self.lab_admin = UserFactory.create(username=f"{prefix}_lab_admin")
-        self.lab.admin_group.user_set.add(self.lab_admin)
-        self.lab_other_team = TeamFactory.create(
-            name=f"{prefix} Other Team", lab=self.lab
+        Of particular note, this creates a cls.user and cls.admin
+        who are member/admin in cls.lab_team.
+
+        These are created once per test class, in setUpTestData,
+        and each test gets its own copy of them.
+        """
+        prefix = cls.stub
+
+        cls.lab = LabFactory.create(name=f"{prefix} Lab")
+        cls.lab_team = TeamFactory.create(name=f"{prefix} Lab Team", lab=cls.lab)
+        cls.user = UserFactory.create(username=f"{prefix}_user")
+        cls.lab_team.member_group.user_set.add(cls.user)
+        cls.admin = UserFactory.create(username=f"{prefix}_admin")
+        cls.lab_team.admin_group.user_set.add(cls.admin)
+        cls.lab_admin = UserFactory.create(username=f"{prefix}_lab_admin")
+        cls.lab.admin_group.user_set.add(cls.lab_admin)
+        cls.lab_other_team = TeamFactory.create(
+            name=f"{prefix} Other Team", lab=cls.lab
         )
-        self.strange_lab = LabFactory.create(name=f"{prefix} Strange Lab")
-        self.strange_lab_team = TeamFactory.create(
-            name=f"{prefix} Strange Lab Team", lab=self.strange_lab
+        cls.strange_lab = LabFactory.create(name=f"{prefix} Strange Lab")
+        cls.strange_lab_team = TeamFactory.create(
+            name=f"{prefix} Strange Lab Team", lab=cls.strange_lab
         )
-        self.strange_lab_admin = UserFactory.create(
+        cls.strange_lab_admin = UserFactory.create(
             username=f"{prefix}_strange_lab_admin"
         )
-        self.strange_lab.admin_group.user_set.add(self.strange_lab_admin)
-        self.strange_lab_team.admin_group.user_set.add(self.strange_lab_admin)
+        cls.strange_lab.admin_group.user_set.add(cls.strange_lab_admin)
+        cls.strange_lab_team.admin_group.user_set.add(cls.strange_lab_admin)
 
         # Check we created at least one instance of each type
-        Lab.objects.get(pk=self.lab.pk)
-        Team.objects.get(pk=self.lab_team.pk)
-        UserProxy.objects.get(pk=self.user.pk)
-        GroupProxy.objects.get(pk=self.lab_team.member_group.pk)
-
-        self.create_resource_users_run = True
+        Lab.objects.get(pk=cls.lab.pk)
+        Team.objects.get(pk=cls.lab_team.pk)
+        UserProxy.objects.get(pk=cls.user.pk)
+        GroupProxy.objects.get(pk=cls.lab_team.member_group.pk)
 
     def assertResourceInResults(
         self, resource, result, assert_single_result=True, assert_reachable=True
@@ -11,6 +11,7 @@ import os
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseRedirect
 from django.urls import NoReverseMatch
+from django.db.models import Exists, OuterRef
 from django.db.models.base import ModelBase
 from django.utils.module_loading import import_string
 from django_filters.rest_framework import DjangoFilterBackend
@@ -21,6 +22,7 @@ from rest_framework.mixins import ListModelMixin
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.renderers import JSONRenderer
 from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
 
 from .serializers import (
     HarvesterSerializer,
@@ -114,11 +116,13 @@ from .permissions import (
 )
 from .serializers.utils import (
     get_GetOrCreateTextStringSerializer,
+    get_output_style,
+    OUTPUT_STYLE_CONTEXT,
     DumpSerializer,
     SerializerDescriptionSerializer,
 )
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
+from django.utils import timezone, translation
 from rest_framework import viewsets, serializers, permissions
 from rest_framework.decorators import (
     action,
@@ -137,8 +141,10 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
     inline_serializer,
+    OpenApiParameter,
     OpenApiResponse,
 )
+from drf_spectacular.views import SpectacularAPIView
 import json
 import time
 import logging
@@ -222,6 +228,22 @@ class MethodPermissionMixin(viewsets.GenericViewSet):
         return super().get_permissions()
 
 
+class EagerLoadingQuerysetMixin(viewsets.GenericViewSet):
+    def get_queryset(self):
+        """
+        Let serializers that know which relations they render load them up front.
+        """
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, "setup_eager_loading"):
+            try:
+                pk_only = get_output_style(self.request) != OUTPUT_STYLE_CONTEXT
+            except AttributeError:  # e.g. schema generation without a real request
+                pk_only = False
+            queryset = serializer_class.setup_eager_loading(queryset, pk_only=pk_only)
+        return queryset
+
+
 class DescribeSelfMixin(MethodPermissionMixin):
     # TODO: This method throws an error looking for a DRF form to display when not in JSON format
     @action(detail=False, methods=["GET"])
@@ -602,6 +624,41 @@ class CreateTokenView(KnoxLoginView):
         ).data
 
 
+class CachedSpectacularAPIView(SpectacularAPIView):
+    # Keep drf-spectacular's own description for the schema endpoint
+    __doc__ = SpectacularAPIView.__doc__
+
+    # The schema only changes when the code does, so generate the default schema
+    # once rather than introspecting every viewset per request.
+    # Other versions and languages are chosen by the client (?version=, ?lang=),
+    # so they are generated on demand and never cached.
+    _default_schema = None
+
+    def _get_schema_response(self, request):
+        version = (
+            self.api_version or request.version or self._get_version_parameter(request)
+        )
+        default_version = self.api_version or api_settings.DEFAULT_VERSION
+        if (version, translation.get_language()) != (
+            default_version,
+            settings.LANGUAGE_CODE,
+        ):
+            return super()._get_schema_response(request)
+        if CachedSpectacularAPIView._default_schema is None:
+            generator = self.generator_class(
+                urlconf=self.urlconf, api_version=version, patterns=self.patterns
+            )
+            CachedSpectacularAPIView._default_schema = generator.get_schema(
+                request=request, public=self.serve_public
+            )
+        return Response(
+            data=CachedSpectacularAPIView._default_schema,
+            headers={
+                "Content-Disposition": f'inline; filename="{self._get_filename(request, version)}"'
+            },
+        )
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="View tokens associated with your account.",
@@ -708,7 +765,17 @@ class LabViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
     ]
     filterset_fields = ["name"]
     search_fields = ["@name"]
-    queryset = Lab.objects.all().order_by("-id")
+    queryset = (
+        Lab.objects.all()
+        .select_related("admin_group")
+        .prefetch_related(
+            "admin_group__user_set",
+            # Consumed by Lab.get_all_storage_types() for LabSerializer.storages
+            "storage_galvstoragetype",
+            "storage_additionals3storagetype",
+        )
+        .order_by("-id")
+    )
     serializer_class = LabSerializer
     http_method_names = ["get", "post", "patch", "delete", "options"]
 
@@ -750,7 +817,23 @@ class TeamViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
     serializer_class = TeamSerializer
     filterset_fields = ["name"]
     search_fields = ["@name"]
-    queryset = Team.objects.all().order_by("-id")
+    queryset = (
+        Team.objects.all()
+        .select_related("admin_group", "member_group")
+        .prefetch_related(
+            "admin_group__user_set",
+            "member_group__user_set",
+            "cellfamily_resources",
+            "cell_resources",
+            "equipmentfamily_resources",
+            "equipment_resources",
+            "schedulefamily_resources",
+            "schedule_resources",
+            "cyclertest_resources",
+            "experiment_resources",
+        )
+        .order_by("-id")
+    )
     http_method_names = ["get", "post", "patch", "delete", "options"]
 
 
@@ -831,7 +914,9 @@ File parsing reports may contain metadata or data to store.
         },
     ),
 )
-class HarvesterViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class HarvesterViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     Harvesters monitor a set of MonitoredPaths and send reports about ObservedFiles
     within those paths.
@@ -883,7 +968,10 @@ class HarvesterViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
 
         Only available to Harvesters.
         """
-        harvester = get_object_or_404(Harvester, id=pk)
+        harvester = get_object_or_404(
+            HarvesterConfigSerializer.setup_eager_loading(Harvester.objects.all()),
+            id=pk,
+        )
         self.check_object_permissions(self.request, harvester)
         return Response(
             HarvesterConfigSerializer(harvester, context={"request": request}).data
@@ -1349,7 +1437,9 @@ or the time for which files need to be stable before being imported.
         """,
     ),
 )
-class MonitoredPathViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class MonitoredPathViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     A MonitoredPath refers to a directory accessible by a Harvester in which
     data files will reside. Those files will be scanned periodically by the Harvester,
@@ -1428,7 +1518,9 @@ harvester program to rerun the import process when it next scans the file.
         """,
     ),
 )
-class ObservedFileViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class ObservedFileViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     ObservedFiles are files that exist (or have existed) in a MonitoredPath and have
     been reported to Galv by the Harvester.
@@ -1472,7 +1564,6 @@ class ObservedFileViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
         except ObservedFile.DoesNotExist:
             return error_response("Requested file not found")
         file.state = FileState.RETRY_IMPORT
-        file.storage_urls = []
         if file.png is not None:
             file.png.delete()
         file.save()
@@ -1794,7 +1885,9 @@ to prevent accidental updating.
         """,
     ),
 )
-class CellFamilyViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class CellFamilyViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     CellFamilies describe types of Cell.
     """
@@ -1862,7 +1955,7 @@ Dump the Cell in RDF (JSON-LD) format.
         """,
     ),
 )
-class CellViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class CellViewSet(EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet):
     """
     Cells are specific cells which have generated data stored in Datasets/ObservedFiles.
     """
@@ -1944,7 +2037,9 @@ to prevent accidental updating.
         """,
     ),
 )
-class EquipmentFamilyViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class EquipmentFamilyViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     EquipmentFamilies describe types of Equipment.
     """
@@ -2001,7 +2096,9 @@ Equipment that _is_ used in a Cycler Tests is locked to prevent accidental updat
         """,
     ),
 )
-class EquipmentViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class EquipmentViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     Equipment can be attached to Datasets and used to view Datasets which
     have used similar equipment.
@@ -2071,7 +2168,9 @@ to prevent accidental updating.
         """,
     ),
 )
-class ScheduleFamilyViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class ScheduleFamilyViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     Schedules can be attached to Cycler Tests and used to view Cycler Tests which
     have used similar equipment.
@@ -2128,7 +2227,9 @@ Schedules that _is_ used in a Cycler Tests is locked to prevent accidental updat
         """,
     ),
 )
-class ScheduleViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class ScheduleViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     Schedules can be attached to Cycler Tests and used to view Cycler Tests which
     have used similar equipment.
@@ -2147,7 +2248,21 @@ class ScheduleViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
     http_method_names = ["get", "post", "patch", "delete", "options"]
 
 
-class CyclerTestViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+@extend_schema_view(
+    list=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "include",
+                str,
+                description="Comma-separated extra fields to render in list results. "
+                "`rendered_schedule` is only rendered in lists when included here.",
+            ),
+        ],
+    ),
+)
+class CyclerTestViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     Cycler Tests are the primary object in the database.
     They represent a single test conducted on a specific cell using specific equipment,
@@ -2202,7 +2317,9 @@ Experiments are collections of Cycler Tests which are grouped together for analy
         """,
     ),
 )
-class ExperimentViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class ExperimentViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     Experiments are collections of Cycler Tests which are grouped together for analysis.
     """
@@ -2358,7 +2475,18 @@ class UserViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
     serializer_class = UserSerializer
     filter_fields = ["username", "email", "lab__id", "lab__name", "team__name"]
     search_fields = ["@username", "@email", "=lab__name", "=team__name"]
-    queryset = UserProxy.objects.filter(is_active=True).order_by("id")
+    queryset = (
+        UserProxy.objects.filter(is_active=True)
+        .annotate(
+            # Read by UserSerializer.get_is_lab_admin to avoid a query per user
+            is_lab_admin=Exists(
+                GroupProxy.objects.filter(
+                    user=OuterRef("pk"), editable_lab__isnull=False
+                )
+            )
+        )
+        .order_by("id")
+    )
     http_method_names = ["get", "post", "patch", "options"]
 
 
@@ -2483,7 +2611,9 @@ class ValidationSchemaViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
         )
 
 
-class SchemaValidationViewSet(DescribeSelfMixin, viewsets.ReadOnlyModelViewSet):
+class SchemaValidationViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     SchemaValidations are the results of validating Galv objects against ValidationSchemas.
     """
@@ -2535,7 +2665,9 @@ You can change the visibility of a file and its metadata. Files themselves canno
         description="""Delete a file from the database and from the S3 bucket.""",
     ),
 )
-class ArbitraryFileViewSet(DescribeSelfMixin, viewsets.ModelViewSet):
+class ArbitraryFileViewSet(
+    EagerLoadingQuerysetMixin, DescribeSelfMixin, viewsets.ModelViewSet
+):
     """
     ArbitraryFiles are files that are not observed by the harvester, and are not
     associated with any specific experiment or dataset. They are used to store
@@ -2721,12 +2853,19 @@ class AdditionalS3StorageTypeViewSet(
     http_method_names = ["get", "post", "patch", "delete", "options"]
 
 
-def get_storage_url(model, view_suffix, *args, **kwargs):
+def get_storage_view_name(model, view_suffix):
     """
-    Retrieve the URL for a storage type. Args and kwargs are passed to the DRF reverse function.
+    Retrieve the view name for a storage type, e.g. 'galvstoragetype-detail'.
     """
     all_storage_views = _StorageTypeMixin.__subclasses__()
     for view in all_storage_views:
         if view.model == model:
-            return reverse(f"{view.view_prefix}-{view_suffix}", *args, **kwargs)
+            return f"{view.view_prefix}-{view_suffix}"
     raise ValueError(f"Model {model} not found in storage views")
+
+
+def get_storage_url(model, view_suffix, *args, **kwargs):
+    """
+    Retrieve the URL for a storage type. Args and kwargs are passed to the DRF reverse function.
+    """
+    return reverse(get_storage_view_name(model, view_suffix), *args, **kwargs)